@@ -4,11 +4,136 @@ Handles loading and validating configuration settings.
 """
 
 import os
-import yaml
+import copy
+import hashlib
+import functools
 import logging
+from pathlib import Path
+from collections import OrderedDict
 
 logger = logging.getLogger(__name__)
 
+# Schema for the configuration file, compiled into a validator function by _get_validator
+_CONFIG_SCHEMA = {
+    'type': 'object',
+    'required': ['database', 'sources', 'ai', 'reporting'],
+    'properties': {
+        'database': {
+            'type': 'object',
+            'required': ['path']
+        },
+        'sources': {
+            'type': 'array',
+            'minItems': 1
+        },
+        'ai': {
+            'type': 'object',
+            'required': ['api_key']
+        },
+        'reporting': {
+            'type': 'object',
+            'required': ['output_directory'],
+            'properties': {
+                'time_window_days': {'type': 'integer', 'default': 30}
+            }
+        }
+    }
+}
+
+@functools.lru_cache(maxsize=None)
+def _get_validator():
+    """
+    Compile the configuration schema on first use and reuse it process-wide.
+    
+    Returns:
+        callable: Validator raising fastjsonschema.JsonSchemaException on failure
+    """
+    import fastjsonschema
+    return fastjsonschema.compile(_CONFIG_SCHEMA)
+
+@functools.lru_cache(maxsize=None)
+def _yaml_codec():
+    """
+    Import PyYAML on first use, preferring the libyaml-backed loader.
+    
+    Returns:
+        tuple: (yaml module, safe loader class)
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader
+    return yaml, loader
+
+# Parsed configurations keyed by (real path, mtime in ns, size in bytes)
+_CONFIG_CACHE = {}
+
+# Parsed configurations keyed by a digest of the raw file contents (LRU order)
+_CONTENT_CACHE = OrderedDict()
+_CONTENT_CACHE_SIZE = 64
+
+def _parse_and_validate(raw):
+    """
+    Parse and validate raw YAML configuration.
+    
+    Args:
+        raw (bytes): YAML document
+    
+    Returns:
+        dict: Validated configuration
+    """
+    yaml, loader = _yaml_codec()
+    config = yaml.load(raw, Loader=loader)
+    
+    # Validate against the compiled schema (also fills in defaults such as
+    # reporting.time_window_days)
+    _get_validator()(config)
+    
+    return config
+
+def _parse_and_validate_cached(raw):
+    """
+    Parse and validate raw YAML configuration, reusing the result for identical content.
+    
+    The returned dictionary is shared with the cache and must not be modified.
+    
+    Args:
+        raw (bytes): YAML document
+    
+    Returns:
+        dict: Validated configuration
+    """
+    digest = hashlib.blake2b(raw, digest_size=16).digest()
+    config = _CONTENT_CACHE.get(digest)
+    
+    if config is None:
+        config = _parse_and_validate(raw)
+        _CONTENT_CACHE[digest] = config
+        if len(_CONTENT_CACHE) > _CONTENT_CACHE_SIZE:
+            _CONTENT_CACHE.popitem(last=False)
+    else:
+        _CONTENT_CACHE.move_to_end(digest)
+    
+    return config
+
+def _finalize_config(config):
+    """
+    Hand out a private copy of a cached configuration and prepare its output directory.
+    
+    Args:
+        config (dict): Cached configuration
+    
+    Returns:
+        dict: Configuration settings
+    """
+    config = copy.deepcopy(config)
+    
+    # Create output directory if it doesn't exist
+    os.makedirs(config['reporting']['output_directory'], exist_ok=True)
+    
+    return config
+
 def load_config(config_path):
     """
     Load configuration from a YAML file.
@@ -21,42 +146,73 @@ def load_config(config_path):
         
     Raises:
         FileNotFoundError: If the configuration file doesn't exist
-        ValueError: If the configuration is invalid
+        ValueError: If the configuration is invalid (raised as
+            fastjsonschema.JsonSchemaException, naming the offending field)
     """
-    if not os.path.exists(config_path):
+    try:
+        st = os.stat(config_path)
+    except FileNotFoundError:
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
     
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
-    
-    # Validate required configuration sections
-    required_sections = ['database', 'sources', 'ai', 'reporting']
-    for section in required_sections:
-        if section not in config:
-            raise ValueError(f"Missing required configuration section: {section}")
-    
-    # Validate database configuration
-    if 'path' not in config['database']:
-        raise ValueError("Database path not specified in configuration")
+    # Reuse the parsed configuration if the file hasn't changed since the last load
+    real_path = os.path.realpath(config_path)
+    key = (real_path, st.st_mtime_ns, st.st_size)
+    config = _CONFIG_CACHE.get(key)
     
-    # Validate sources configuration
-    if not config['sources'] or not isinstance(config['sources'], list):
-        raise ValueError("No intelligence sources specified in configuration")
-    
-    # Validate AI configuration
-    if 'api_key' not in config['ai']:
-        raise ValueError("AI API key not specified in configuration")
+    if config is None:
+        # Read the whole file in one go; a touched but unchanged file is still
+        # served from the content cache
+        with open(config_path, 'rb') as f:
+            raw = f.read()
+        config = _parse_and_validate_cached(raw)
+        
+        # Drop entries for older versions of this file
+        for stale in [k for k in _CONFIG_CACHE if k[0] == real_path]:
+            del _CONFIG_CACHE[stale]
+        _CONFIG_CACHE[key] = config
     
-    # Validate reporting configuration
-    if 'output_directory' not in config['reporting']:
-        raise ValueError("Reporting output directory not specified in configuration")
-    if 'time_window_days' not in config['reporting']:
-        config['reporting']['time_window_days'] = 30  # Default to 30 days if not specified
+    return _finalize_config(config)
+
+def load_config_from_bytes(raw):
+    """
+    Load configuration from raw YAML bytes, e.g. content fetched remotely or
+    generated in memory.
     
-    # Create output directory if it doesn't exist
-    os.makedirs(config['reporting']['output_directory'], exist_ok=True)
+    Args:
+        raw (bytes): YAML document
     
-    return config
+    Returns:
+        dict: Configuration settings
+        
+    Raises:
+        ValueError: If the configuration is invalid
+    """
+    return _finalize_config(_parse_and_validate_cached(raw))
+
+# get_default_config() as emitted by yaml.dump(..., default_flow_style=False);
+# keep the two in sync
+_DEFAULT_CONFIG_YAML = """ai:
+  api_key: YOUR_API_KEY_HERE
+  model: claude-3-opus-20240229
+database:
+  path: data/cti.db
+reporting:
+  output_directory: reports
+  time_window_days: 30
+sources:
+- feed_url: https://krebsonsecurity.com/feed/
+  name: Krebs on Security
+  type: rss
+  url: https://krebsonsecurity.com
+- feed_url: https://www.bleepingcomputer.com/feed/
+  name: Bleeping Computer
+  type: rss
+  url: https://www.bleepingcomputer.com
+- feed_url: https://feeds.feedburner.com/TheHackersNews
+  name: The Hacker News
+  type: rss
+  url: https://thehackernews.com
+"""
 
 def get_default_config():
     """
@@ -110,9 +266,7 @@ def create_default_config(output_path='config.yaml'):
         bool: True if successful, False otherwise
     """
     try:
-        config = get_default_config()
-        with open(output_path, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False)
+        Path(output_path).write_text(_DEFAULT_CONFIG_YAML)
         return True
     except Exception as e:
         logger.error(f"Failed to create default configuration: {str(e)}")
@@ -0,0 +1,74 @@
+"""
+Context gate module for PRISM.
+Trims long article text to its most informative paragraphs before it's sent to Claude.
+"""
+
+import re
+import logging
+
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r'\w+')
+
+# Terms marking a paragraph as likely to carry threat intelligence
+_CTI_KEYWORDS = frozenset([
+    'apt', 'actor', 'attribution', 'backdoor', 'botnet', 'c2', 'campaign',
+    'cve', 'exfiltration', 'exploit', 'exploited', 'implant', 'indicators',
+    'ioc', 'iocs', 'lateral', 'loader', 'malware', 'payload', 'persistence',
+    'phishing', 'ransomware', 'rce', 'stealer', 'trojan', 'ttp', 'ttps',
+    'vulnerability', 'webshell', 'zero-day'
+])
+
+# Title words shorter than this (articles, prepositions, ...) aren't scored
+_MIN_TITLE_WORD_LENGTH = 4
+
+def compress(title, content, iocs=None, max_chars=12000):
+    """
+    Reduce content to its most informative paragraphs, in their original order.
+
+    Paragraphs are scored by the title words they share, the extracted IOCs
+    they mention (weighted highest) and the CTI keywords they contain. The
+    best are kept until max_chars is reached. Content within the limit is
+    returned unchanged.
+
+    Args:
+        title (str): Article title
+        content (str): Article content
+        iocs (dict, optional): Extracted IOCs by type
+        max_chars (int): Maximum length of the returned text
+
+    Returns:
+        str: Content of at most max_chars characters
+    """
+    if not content or len(content) <= max_chars:
+        return content
+
+    # Scraped text is usually one block per line rather than blank-line separated
+    separator = '\n\n' if '\n\n' in content else '\n'
+    paragraphs = [p for p in content.split(separator) if p.strip()]
+
+    title_words = {w for w in _WORD_RE.findall(title.lower()) if len(w) >= _MIN_TITLE_WORD_LENGTH}
+    ioc_values = [ioc['value'] for ioc_list in (iocs or {}).values() for ioc in ioc_list]
+
+    scores = []
+    for index, paragraph in enumerate(paragraphs):
+        words = set(_WORD_RE.findall(paragraph.lower()))
+        score = len(words & title_words) + len(words & _CTI_KEYWORDS)
+        score += 3 * sum(1 for value in ioc_values if value in paragraph)
+        scores.append((-score, index))
+
+    # Take paragraphs best first (earlier ones on ties) while they fit
+    kept = []
+    remaining = max_chars
+    for _, index in sorted(scores):
+        length = len(paragraphs[index]) + len(separator)
+        if length <= remaining:
+            kept.append(index)
+            remaining -= length
+
+    if not kept:
+        # Not even the best paragraph fits on its own
+        return paragraphs[sorted(scores)[0][1]][:max_chars]
+
+    logger.debug(f"Kept {len(kept)} of {len(paragraphs)} paragraphs of: {title}")
+    return separator.join(paragraphs[index] for index in sorted(kept))
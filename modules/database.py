@@ -11,6 +11,45 @@ from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+_INSERT_ARTICLE_SQL = '''
+INSERT INTO articles (source, title, url, author, published_date, content, 
+                    summary, scraped_date, analyzed_date)
+VALUES (:source, :title, :url, :author, :published_date, :content, 
+        :summary, :scraped_date, :analyzed_date)
+'''
+
+_INSERT_TAG_SQL = '''
+INSERT OR IGNORE INTO tags (article_id, tag)
+VALUES (?, ?)
+'''
+
+_INSERT_IOC_SQL = '''
+INSERT OR IGNORE INTO iocs (article_id, type, value, context)
+VALUES (?, ?, ?, ?)
+'''
+
+_UPDATE_SUMMARY_SQL = '''
+UPDATE articles
+SET summary = ?, analyzed_date = ?
+WHERE id = ?
+'''
+
+_SELECT_IOCS_SQL = '''
+SELECT article_id, type, value, context
+FROM iocs
+WHERE article_id IN ({placeholders})
+'''
+
+# Maximum host parameters per statement in older SQLite builds
+_MAX_SQL_PARAMS = 999
+
+# Title keywords that mark a Volexity article as attributing a threat actor
+_ACTOR_KEYWORDS = (
+    'apt', 'group', 'threat actor', 'campaign', 'operation',
+    'hackers', 'north korea', 'china', 'russia', 'iran', 'lazarus',
+    'conti', 'fin7', 'cozy bear', 'fancy bear', 'kimsuky', 'mustang panda'
+)
+
 class DatabaseManager:
     """Manages SQLite database operations for the CTI Aggregator"""
     
@@ -102,6 +141,62 @@ class DatabaseManager:
             if conn:
                 conn.close()
     
+    def _insert_article(self, cursor, article, current_time):
+        """
+        Insert an article and its tags, unless it's already stored.
+        
+        Args:
+            cursor (sqlite3.Cursor): Cursor of the open transaction
+            article (dict): Article data, see store_article
+            current_time (str): Scrape timestamp to record
+        
+        Returns:
+            int: Article ID
+        """
+        # Check if article already exists (by URL)
+        cursor.execute('SELECT id FROM articles WHERE url = ?', (article['url'],))
+        existing = cursor.fetchone()
+        
+        if existing:
+            logger.info(f"Article already exists in database: {article['url']}")
+            return existing['id']
+        
+        # Prepare article data
+        article_data = {
+            'source': article['source'],
+            'title': article['title'],
+            'url': article['url'],
+            'author': article.get('author', ''),
+            'published_date': article.get('published_date', ''),
+            'content': article['content'],
+            'summary': None,  # Will be filled by AI summarizer
+            'scraped_date': current_time,
+            'analyzed_date': None
+        }
+        
+        # Insert article
+        cursor.execute(_INSERT_ARTICLE_SQL, article_data)
+        
+        article_id = cursor.lastrowid
+        
+        # Store tags if provided
+        tags = list(article.get('tags') or ())
+        
+        # Add source-specific tags
+        if article['source'] == 'Volexity Blog':
+            # Common tags for Volexity articles
+            tags.extend(['volexity', 'threat-research'])
+            
+            # Try to extract threat actor names from title
+            title_lower = article['title'].lower()
+            if any(keyword in title_lower for keyword in _ACTOR_KEYWORDS):
+                tags.append('apt-attribution')
+        
+        if tags:
+            cursor.executemany(_INSERT_TAG_SQL, [(article_id, tag) for tag in tags])
+        
+        return article_id
+    
     def store_article(self, article):
         """
         Store an article in the database.
@@ -123,70 +218,7 @@ class DatabaseManager:
             conn = self.get_connection()
             cursor = conn.cursor()
             
-            # Check if article already exists (by URL)
-            cursor.execute('SELECT id FROM articles WHERE url = ?', (article['url'],))
-            existing = cursor.fetchone()
-            
-            if existing:
-                logger.info(f"Article already exists in database: {article['url']}")
-                return existing['id']
-            
-            # Prepare article data
-            current_time = datetime.now().isoformat()
-            
-            article_data = {
-                'source': article['source'],
-                'title': article['title'],
-                'url': article['url'],
-                'author': article.get('author', ''),
-                'published_date': article.get('published_date', ''),
-                'content': article['content'],
-                'summary': None,  # Will be filled by AI summarizer
-                'scraped_date': current_time,
-                'analyzed_date': None
-            }
-            
-            # Insert article
-            cursor.execute('''
-            INSERT INTO articles (source, title, url, author, published_date, content, 
-                                summary, scraped_date, analyzed_date)
-            VALUES (:source, :title, :url, :author, :published_date, :content, 
-                    :summary, :scraped_date, :analyzed_date)
-            ''', article_data)
-            
-            article_id = cursor.lastrowid
-            
-            # Store tags if provided
-            if 'tags' in article and article['tags']:
-                for tag in article['tags']:
-                    cursor.execute('''
-                    INSERT OR IGNORE INTO tags (article_id, tag)
-                    VALUES (?, ?)
-                    ''', (article_id, tag))
-            
-            # Add source-specific tags
-            if article['source'] == 'Volexity Blog':
-                # Common tags for Volexity articles
-                default_tags = ['volexity', 'threat-research']
-                for tag in default_tags:
-                    cursor.execute('''
-                    INSERT OR IGNORE INTO tags (article_id, tag)
-                    VALUES (?, ?)
-                    ''', (article_id, tag))
-                
-                # Try to extract threat actor names from title
-                title_lower = article['title'].lower()
-                actor_keywords = [
-                    'apt', 'group', 'threat actor', 'campaign', 'operation',
-                    'hackers', 'north korea', 'china', 'russia', 'iran', 'lazarus',
-                    'conti', 'fin7', 'cozy bear', 'fancy bear', 'kimsuky', 'mustang panda'
-                ]
-                
-                if any(keyword in title_lower for keyword in actor_keywords):
-                    cursor.execute('''
-                    INSERT OR IGNORE INTO tags (article_id, tag)
-                    VALUES (?, ?)
-                    ''', (article_id, 'apt-attribution'))
+            article_id = self._insert_article(cursor, article, datetime.now().isoformat())
             
             conn.commit()
             logger.info(f"Stored article: {article['title']} (ID: {article_id})")
@@ -202,6 +234,54 @@ class DatabaseManager:
             if conn:
                 conn.close()
     
+    def store_articles_bulk(self, articles):
+        """
+        Store several articles in a single transaction.
+        
+        Each article is inserted under its own savepoint, so a record the
+        schema rejects (e.g. a missing title) is skipped on its own.
+        
+        Args:
+            articles (list): List of article dictionaries, see store_article
+        
+        Returns:
+            list: Article IDs in the order of articles, None for rejected
+                articles, all None if the transaction failed
+        """
+        if not articles:
+            return []
+        
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            current_time = datetime.now().isoformat()
+            cursor.execute('BEGIN')
+            article_ids = []
+            for article in articles:
+                cursor.execute('SAVEPOINT article')
+                try:
+                    article_ids.append(self._insert_article(cursor, article, current_time))
+                except sqlite3.IntegrityError as e:
+                    logger.warning(f"Skipping article {article.get('url')}: {str(e)}")
+                    cursor.execute('ROLLBACK TO article')
+                    article_ids.append(None)
+                cursor.execute('RELEASE article')
+            
+            conn.commit()
+            logger.info(f"Stored {sum(1 for article_id in article_ids if article_id is not None)} of {len(articles)} articles")
+            return article_ids
+            
+        except sqlite3.Error as e:
+            logger.error(f"SQLite error storing articles: {str(e)}")
+            if conn:
+                conn.rollback()
+            return [None] * len(articles)
+            
+        finally:
+            if conn:
+                conn.close()
+    
     def store_iocs(self, article_id, iocs):
         """
         Store IOCs associated with an article.
@@ -215,6 +295,21 @@ class DatabaseManager:
                     'hash': [...]
                 }
         
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if self.store_iocs_bulk([(article_id, iocs)]):
+            logger.info(f"Stored IOCs for article ID {article_id}")
+            return True
+        return False
+    
+    def store_iocs_bulk(self, article_iocs):
+        """
+        Store the IOCs of several articles in a single transaction.
+        
+        Args:
+            article_iocs (list): (article ID, dictionary of IOCs by type) pairs
+        
         Returns:
             bool: True if successful, False otherwise
         """
@@ -222,15 +317,14 @@ class DatabaseManager:
             conn = self.get_connection()
             cursor = conn.cursor()
             
-            for ioc_type, ioc_list in iocs.items():
-                for ioc in ioc_list:
-                    cursor.execute('''
-                    INSERT OR IGNORE INTO iocs (article_id, type, value, context)
-                    VALUES (?, ?, ?, ?)
-                    ''', (article_id, ioc_type, ioc['value'], ioc.get('context', '')))
+            cursor.executemany(_INSERT_IOC_SQL, (
+                (article_id, ioc_type, ioc['value'], ioc.get('context', ''))
+                for article_id, iocs in article_iocs
+                for ioc_type, ioc_list in iocs.items()
+                for ioc in ioc_list
+            ))
             
             conn.commit()
-            logger.info(f"Stored IOCs for article ID {article_id}")
             return True
             
         except sqlite3.Error as e:
@@ -260,11 +354,7 @@ class DatabaseManager:
             
             current_time = datetime.now().isoformat()
             
-            cursor.execute('''
-            UPDATE articles
-            SET summary = ?, analyzed_date = ?
-            WHERE id = ?
-            ''', (summary, current_time, article_id))
+            cursor.execute(_UPDATE_SUMMARY_SQL, (summary, current_time, article_id))
             
             conn.commit()
             logger.info(f"Updated summary for article ID {article_id}")
@@ -280,6 +370,63 @@ class DatabaseManager:
             if conn:
                 conn.close()
     
+    def update_article_summaries(self, summaries):
+        """
+        Update several articles with their AI-generated summaries in a single transaction.
+        
+        Args:
+            summaries (list): (article ID, summary) pairs
+        
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            current_time = datetime.now().isoformat()
+            
+            cursor.executemany(_UPDATE_SUMMARY_SQL, [
+                (summary, current_time, article_id) for article_id, summary in summaries
+            ])
+            
+            conn.commit()
+            logger.info(f"Updated summaries for {len(summaries)} articles")
+            return True
+            
+        except sqlite3.Error as e:
+            logger.error(f"SQLite error updating article summaries: {str(e)}")
+            if conn:
+                conn.rollback()
+            return False
+            
+        finally:
+            if conn:
+                conn.close()
+    
+    def get_known_urls(self):
+        """
+        Get the URLs of all stored articles.
+        
+        Returns:
+            set: Set of article URLs
+        """
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute('SELECT url FROM articles')
+            
+            return {row['url'] for row in cursor.fetchall()}
+            
+        except sqlite3.Error as e:
+            logger.error(f"SQLite error retrieving article URLs: {str(e)}")
+            return set()
+            
+        finally:
+            if conn:
+                conn.close()
+    
     def get_articles_without_summary(self):
         """
         Get articles that don't have an AI summary yet.
@@ -351,6 +498,44 @@ class DatabaseManager:
             if conn:
                 conn.close()
     
+    def get_iocs_for_articles(self, article_ids):
+        """
+        Get the IOCs of several articles at once.
+        
+        Args:
+            article_ids (list): Article IDs
+        
+        Returns:
+            dict: Dictionary of IOCs by type for each article ID (empty for
+                articles without IOCs)
+        """
+        results = {article_id: {} for article_id in article_ids}
+        ids = list(results)
+        
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            for start in range(0, len(ids), _MAX_SQL_PARAMS):
+                chunk = ids[start:start + _MAX_SQL_PARAMS]
+                cursor.execute(_SELECT_IOCS_SQL.format(placeholders=','.join('?' * len(chunk))), chunk)
+                
+                for row in cursor.fetchall():
+                    results[row['article_id']].setdefault(row['type'], []).append({
+                        'value': row['value'],
+                        'context': row['context']
+                    })
+            
+            return results
+            
+        except sqlite3.Error as e:
+            logger.error(f"SQLite error retrieving IOCs: {str(e)}")
+            return {article_id: {} for article_id in article_ids}
+            
+        finally:
+            if conn:
+                conn.close()
+    
     def get_recent_articles_with_summary(self, days=30):
         """
         Get recent articles that have been summarized.
@@ -376,12 +561,12 @@ class DatabaseManager:
             ORDER BY scraped_date DESC
             ''', (cutoff_date,))
             
-            articles = []
-            for row in cursor.fetchall():
-                article = dict(row)
-                # Add IOCs to each article
-                article['iocs'] = self.get_iocs_for_article(article['id'])
-                articles.append(article)
+            articles = [dict(row) for row in cursor.fetchall()]
+            
+            # Add IOCs to each article
+            iocs = self.get_iocs_for_articles([article['id'] for article in articles])
+            for article in articles:
+                article['iocs'] = iocs[article['id']]
                 
             logger.info(f"Retrieved {len(articles)} recent articles with summaries")
             return articles
@@ -57,7 +57,7 @@ class IOCExtractor:
         # Yara rule name pattern
         self.yara_rule_pattern = r'\brule\s+[a-zA-Z0-9_]+\s*{'
         
-        # Initialize patterns list for easy iteration
+        # Initialize patterns list for easy iteration, compiled once up front
         self.patterns = {
             'ip': self.ip_pattern,
             'domain': self.domain_pattern,
@@ -75,6 +75,7 @@ class IOCExtractor:
             'eth_address': self.eth_address_pattern,
             'yara_rule': self.yara_rule_pattern
         }
+        self.patterns = {ioc_type: re.compile(pattern) for ioc_type, pattern in self.patterns.items()}
         
         # List of common false positives to filter out
         self.false_positives = {
@@ -161,7 +162,7 @@ class IOCExtractor:
         
         Args:
             text (str): Text to extract from
-            pattern (str): Regex pattern
+            pattern (str or re.Pattern): Regex pattern
             context_size (int): Number of characters to include as context
         
         Returns:
@@ -0,0 +1,89 @@
+"""
+LLM cache module for PRISM.
+Persists Claude responses so identical requests aren't paid for twice.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+def cache_key(params):
+    """
+    Hash request parameters (model, system prompt, messages, ...) into a cache key.
+
+    Args:
+        params (dict): Keyword arguments for messages.create
+
+    Returns:
+        str: Hex SHA-256 digest of the canonical JSON form of params
+    """
+    raw = json.dumps(params, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return hashlib.sha256(raw).hexdigest()
+
+class LLMCache:
+    """Persistent SQLite cache of Claude responses"""
+
+    def __init__(self, path, ttl=None):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path (str): Path to the SQLite cache file
+            ttl (float, optional): Seconds a response stays valid, forever if None
+        """
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+
+        # WAL lets other processes read the cache while a response is written
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS cache ('
+            'key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at INTEGER NOT NULL)'
+        )
+        self._conn.commit()
+
+    def get(self, key):
+        """
+        Look up a cached response.
+
+        Args:
+            key (str): Cache key, see cache_key
+
+        Returns:
+            str or None: Cached response text, None on a miss or if expired
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT value, created_at FROM cache WHERE key = ?', (key,)
+            ).fetchone()
+
+        if row is None or (self.ttl is not None and time.time() - row[1] > self.ttl):
+            return None
+        return row[0]
+
+    def set(self, key, value):
+        """
+        Store a response.
+
+        Args:
+            key (str): Cache key, see cache_key
+            value (str): Response text
+        """
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO cache (key, value, created_at) VALUES (?, ?, ?)',
+                (key, value, int(time.time()))
+            )
+            self._conn.commit()
+
+    def close(self):
+        """Close the cache database."""
+        with self._lock:
+            self._conn.close()
@@ -5,50 +5,161 @@ Handles generation of reports and executive summaries.
 
 import os
 import logging
+import functools
+from pathlib import Path
 from datetime import datetime
-import markdown
 import json
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
-class ReportGenerator:
-    """Generates reports from executive summaries and article data"""
+# Single Markdown processor shared by all conversions, created on first use
+_MD = None
+
+@functools.lru_cache(maxsize=1024)
+def _render_md(text):
+    """
+    Convert Markdown text to HTML, memoizing identical inputs.
     
-    def __init__(self, template_dir=None):
-        """
-        Initialize the report generator.
-        
-        Args:
-            template_dir (str, optional): Directory containing report templates
-        """
-        # If template_dir not provided, use module directory's templates subfolder
-        if template_dir is None:
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            template_dir = os.path.join(os.path.dirname(current_dir), 'templates')
-        
-        # Ensure template directory exists
-        os.makedirs(template_dir, exist_ok=True)
-        
-        # Create default template if it doesn't exist
-        default_template_path = os.path.join(template_dir, 'executive_summary.html')
-        if not os.path.exists(default_template_path):
-            self.create_default_template(default_template_path)
-        
-        # Initialize Jinja2 environment
-        self.env = Environment(
-            loader=FileSystemLoader(template_dir),
-            autoescape=select_autoescape(['html', 'xml'])
-        )
+    Args:
+        text (str): Markdown text
     
-    def create_default_template(self, template_path):
-        """
-        Create a default HTML template for executive summaries.
-        
-        Args:
-            template_path (str): Path to save the template
-        """
-        default_template = """<!DOCTYPE html>
+    Returns:
+        str: Rendered HTML
+    """
+    global _MD
+    if _MD is None:
+        import markdown
+        _MD = markdown.Markdown()
+    return _MD.reset().convert(text)
+
+# Output directories already created in this process
+_ENSURED_DIRS = set()
+
+def _ensure_dir(path):
+    """
+    Create a directory if needed, skipping the filesystem once it has been ensured.
+    
+    Args:
+        path (str): Directory path
+    """
+    if path not in _ENSURED_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+
+def _write_report(path, chunks):
+    """
+    Write an encoded report atomically.
+    
+    The chunks go to a temporary file which then replaces the target, so
+    readers never see a partially written report.
+    
+    Args:
+        path (str): Destination path
+        chunks (iterable): Encoded report content as bytes chunks
+    """
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        for chunk in chunks:
+            f.write(chunk)
+    os.replace(tmp_path, path)
+
+def _encode_json(value, level=0):
+    """
+    Encode a value as 2-space indented JSON nested at the given depth.
+    
+    Args:
+        value: JSON-serializable value
+        level (int): Nesting depth the value is written at
+    
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        data = orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(value, indent=2).encode('utf-8')
+    
+    # Encoded JSON never contains raw newlines inside strings, so the layout
+    # can be shifted right by re-indenting every line break
+    if level:
+        data = data.replace(b'\n', b'\n' + b'  ' * level)
+    return data
+
+def _iter_json_report(header, articles):
+    """
+    Encode a JSON report piece by piece, one article at a time.
+    
+    The output matches serializing the whole report with indent=2, without
+    holding every encoded article in memory at once.
+    
+    Args:
+        header (dict): Top-level report fields written before the articles
+        articles (iterable): Article dictionaries
+    
+    Yields:
+        bytes: Encoded report chunks
+    """
+    yield b'{\n'
+    for key, value in header.items():
+        yield b'  ' + _encode_json(key) + b': ' + _encode_json(value, 1) + b',\n'
+    
+    yield b'  "articles": ['
+    separator = b'\n    '
+    empty = True
+    for article in articles:
+        yield separator + _encode_json(article, 2)
+        separator = b',\n    '
+        empty = False
+    yield b']\n}' if empty else b'\n  ]\n}'
+
+def _project_article(article, render_summary=False):
+    """
+    Project an article onto the fields used in reports.
+    
+    Args:
+        article (dict): Article dictionary
+        render_summary (bool): Convert a Markdown summary to HTML
+    
+    Returns:
+        dict: New dictionary with the report fields
+    """
+    summary = article.get('summary')
+    if render_summary and summary:
+        summary = _render_md(summary)
+    
+    return {
+        'id': article.get('id'),
+        'title': article.get('title'),
+        'url': article.get('url'),
+        'source': article.get('source'),
+        'published_date': article.get('published_date'),
+        'summary': summary,
+        'iocs': article.get('iocs', {})
+    }
+
+def _prepare_articles(articles, render_summary=False):
+    """
+    Project articles onto the fields used in reports in a single pass.
+    
+    New dictionaries are built rather than modifying the caller's articles, so
+    the same list can safely be reused for other report formats.
+    
+    Args:
+        articles (list): List of article dictionaries
+        render_summary (bool): Convert Markdown summaries to HTML
+    
+    Returns:
+        list: List of projected article dictionaries
+    """
+    return [_project_article(article, render_summary) for article in articles]
+
+# Built-in executive summary template, written out when a template directory has none
+_DEFAULT_TEMPLATE_HTML = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -173,7 +284,7 @@ class ReportGenerator:
 
     <div class="key-section">
         <h2>Key Threat Actors</h2>
-        {% if key_actors %}
+        {% if key_actors and key_actors|length > 0 %}
             {% for actor in key_actors %}
                 <div class="actor">
                     <h3>{{ actor.name }}</h3>
@@ -187,7 +298,7 @@ class ReportGenerator:
 
     <div class="key-section">
         <h2>Critical Indicators of Compromise</h2>
-        {% if critical_iocs %}
+        {% if critical_iocs and critical_iocs|length > 0 %}
             <table>
                 <tr>
                     <th>Type</th>
@@ -209,7 +320,7 @@ class ReportGenerator:
 
     <div class="recommendations">
         <h2>Strategic Recommendations</h2>
-        {% if recommendations %}
+        {% if recommendations and recommendations|length > 0 %}
             <ol>
                 {% for rec in recommendations %}
                     <li>{{ rec }}</li>
@@ -236,16 +347,321 @@ class ReportGenerator:
     {% endif %}
 
     <div class="footer">
-        <p>This report was automatically generated by the Cyber Threat Intelligence Aggregator.</p>
+        <p>This report was automatically generated by PRISM - Predictive Reconnaissance & Intelligence Security Monitoring.</p>
         <p>Confidential - For internal use only</p>
     </div>
 </body>
 </html>
 """
-        os.makedirs(os.path.dirname(template_path), exist_ok=True)
-        with open(template_path, 'w') as f:
-            f.write(default_template)
+
+# Fixed fragments of the built-in template, used to render it without Jinja2.
+# The head (including the stylesheet) is sliced from the template itself; the
+# remaining fragments mirror its markup, including the whitespace Jinja2 leaves
+# around block tags.
+_HTML_HEAD, _HTML_STYLE, _ = _DEFAULT_TEMPLATE_HTML.split('{{ title }}')
+_HTML_TAIL = _DEFAULT_TEMPLATE_HTML[_DEFAULT_TEMPLATE_HTML.rindex('{% endif %}') + len('{% endif %}'):].rstrip('\n')
+
+_HTML_INTRO = """</h1>
+        <p class="date">Generated on {date}</p>
+    </div>
+
+    <div class="executive-summary">
+        <h2>Executive Summary</h2>
+        {executive_summary}
+    </div>
+
+    <div class="key-section">
+        <h2>Key Threat Actors</h2>
+        """
+_HTML_ACTOR = """
+                <div class="actor">
+                    <h3>{name}</h3>
+                    <p>{description}</p>
+                </div>
+            """
+_HTML_NO_ACTORS = """
+            <p>No key threat actors identified in this reporting period.</p>
+        """
+_HTML_IOCS_START = """
+    </div>
+
+    <div class="key-section">
+        <h2>Critical Indicators of Compromise</h2>
+        """
+_HTML_IOC_TABLE_START = """
+            <table>
+                <tr>
+                    <th>Type</th>
+                    <th>Value</th>
+                    <th>Description</th>
+                </tr>
+                """
+_HTML_IOC_ROW = """
+                    <tr>
+                        <td>{type}</td>
+                        <td class="ioc">{value}</td>
+                        <td>{description}</td>
+                    </tr>
+                """
+_HTML_IOC_TABLE_END = """
+            </table>
+        """
+_HTML_NO_IOCS = """
+            <p>No critical IOCs identified in this reporting period.</p>
+        """
+_HTML_RECS_START = """
+    </div>
+
+    <div class="recommendations">
+        <h2>Strategic Recommendations</h2>
+        """
+_HTML_REC = """
+                    <li>{rec}</li>
+                """
+_HTML_NO_RECS = """
+            <p>No strategic recommendations for this reporting period.</p>
+        """
+_HTML_ARTICLES_START = """
+    </div>
+
+    <h2>Recent Threat Intelligence</h2>
+    """
+_HTML_ARTICLE = """
+            <div class="article">
+                <h3><a href="{url}">{title}</a></h3>
+                <p class="article-source">Source: {source} | {published_date}</p>
+                <div class="article-summary">
+                    {summary}
+                </div>
+            </div>
+        """
+_HTML_NO_ARTICLES = """
+        <p>No recent articles available.</p>
+    """
+
+# Same replacements as Jinja2's autoescaping (markupsafe.escape)
+_HTML_ESCAPES = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&#34;', "'": '&#39;'})
+
+def _esc(value):
+    """
+    Escape a value for HTML output.
+    
+    Args:
+        value: Value to render
+    
+    Returns:
+        str: Escaped string
+    """
+    return str(value).translate(_HTML_ESCAPES)
+
+def _field(item, key):
+    """
+    Look up a template field on a dict, rendering missing fields as empty strings.
+    
+    Args:
+        item: Dictionary (or object) to read from
+        key (str): Field name
+    
+    Returns:
+        str: Escaped field value
+    """
+    if isinstance(item, dict):
+        return _esc(item[key]) if key in item else ''
+    return _esc(getattr(item, key, ''))
+
+def _render_html_fast(ctx):
+    """
+    Render the built-in executive summary template with plain string formatting.
+    
+    Produces the same output as rendering _DEFAULT_TEMPLATE_HTML through Jinja2.
+    
+    Args:
+        ctx (dict): Template data as prepared by generate_html_report
+    
+    Returns:
+        str: Rendered HTML
+    """
+    title = _esc(ctx['title'])
+    parts = [
+        _HTML_HEAD, title, _HTML_STYLE, title,
+        _HTML_INTRO.format(date=_esc(ctx['date']), executive_summary=ctx['executive_summary'])
+    ]
+    
+    key_actors = ctx['key_actors']
+    if key_actors:
+        parts.append('\n            ')
+        for actor in key_actors:
+            parts.append(_HTML_ACTOR.format(name=_field(actor, 'name'), description=_field(actor, 'description')))
+        parts.append('\n        ')
+    else:
+        parts.append(_HTML_NO_ACTORS)
+    
+    parts.append(_HTML_IOCS_START)
+    critical_iocs = ctx['critical_iocs']
+    if critical_iocs:
+        parts.append(_HTML_IOC_TABLE_START)
+        for ioc in critical_iocs:
+            parts.append(_HTML_IOC_ROW.format(
+                type=_field(ioc, 'type'), value=_field(ioc, 'value'), description=_field(ioc, 'description')
+            ))
+        parts.append(_HTML_IOC_TABLE_END)
+    else:
+        parts.append(_HTML_NO_IOCS)
+    
+    parts.append(_HTML_RECS_START)
+    recommendations = ctx['recommendations']
+    if recommendations:
+        parts.append('\n            <ol>\n                ')
+        for rec in recommendations:
+            parts.append(_HTML_REC.format(rec=_esc(rec)))
+        parts.append('\n            </ol>\n        ')
+    else:
+        parts.append(_HTML_NO_RECS)
+    
+    parts.append(_HTML_ARTICLES_START)
+    articles = ctx['articles']
+    if articles:
+        parts.append('\n        ')
+        for article in articles:
+            parts.append(_HTML_ARTICLE.format(
+                url=_field(article, 'url'),
+                title=_field(article, 'title'),
+                source=_field(article, 'source'),
+                published_date=_field(article, 'published_date'),
+                summary=article.get('summary', '')
+            ))
+        parts.append('\n    ')
+    else:
+        parts.append(_HTML_NO_ARTICLES)
+    
+    parts.append(_HTML_TAIL)
+    return ''.join(parts)
+
+# Default template directory: the templates folder next to the modules package
+_DEFAULT_TEMPLATE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'templates'
+)
+
+class ReportGenerator:
+    """Generates reports from executive summaries and article data"""
+    
+    # Template directories already created and verified in this process
+    _initialized_dirs = set()
+    
+    def __init__(self, template_dir=None):
+        """
+        Initialize the report generator.
+        
+        Args:
+            template_dir (str, optional): Directory containing report templates
+        """
+        # If template_dir not provided, use module directory's templates subfolder
+        if template_dir is None:
+            template_dir = _DEFAULT_TEMPLATE_DIR
+        
+        # Set up each template directory only once per process
+        if template_dir not in ReportGenerator._initialized_dirs:
+            # Ensure template directory exists
+            os.makedirs(template_dir, exist_ok=True)
+            
+            # Create default template if it doesn't exist
+            default_template_path = os.path.join(template_dir, 'executive_summary.html')
+            if not os.path.exists(default_template_path):
+                self.create_default_template(default_template_path)
             
+            ReportGenerator._initialized_dirs.add(template_dir)
+        
+        self.template_dir = template_dir
+        
+        # The Jinja2 environment is only needed for HTML output, so it is
+        # created on first use
+        self.env = None
+        self._exec_template = None
+        self._uses_default_template = None
+    
+    def _get_exec_template(self):
+        """
+        Get the compiled executive summary template, setting up Jinja2 on first use.
+        
+        The template source is compiled once (or loaded from the on-disk bytecode
+        cache) and wrapped directly, bypassing the loader lookup on each render.
+        
+        Returns:
+            jinja2.Template: Compiled template
+        """
+        if self._exec_template is None:
+            from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, select_autoescape
+            
+            # Use an on-disk bytecode cache so compiled templates are reused across runs
+            bytecode_dir = os.path.join(self.template_dir, '.jinja_cache')
+            os.makedirs(bytecode_dir, exist_ok=True)
+            self.env = Environment(
+                loader=FileSystemLoader(self.template_dir),
+                autoescape=select_autoescape(['html', 'xml']),
+                bytecode_cache=FileSystemBytecodeCache(directory=bytecode_dir),
+                auto_reload=False
+            )
+            
+            template_name = 'executive_summary.html'
+            template_path = os.path.join(self.template_dir, template_name)
+            with open(template_path, 'r', encoding='utf-8') as f:
+                source = f.read()
+            
+            bucket = self.env.bytecode_cache.get_bucket(self.env, template_name, template_path, source)
+            code = bucket.code
+            if code is None:
+                code = self.env.compile(source, name=template_name, filename=template_path)
+                bucket.code = code
+                self.env.bytecode_cache.set_bucket(bucket)
+            
+            self._exec_template = self.env.template_class.from_code(
+                self.env, code, self.env.make_globals(None)
+            )
+        
+        return self._exec_template
+    
+    def _is_default_template(self):
+        """
+        Check whether the template on disk is the built-in one, which can be
+        rendered without Jinja2.
+        
+        Returns:
+            bool: True if the executive summary template is unmodified
+        """
+        if self._uses_default_template is None:
+            template_path = os.path.join(self.template_dir, 'executive_summary.html')
+            with open(template_path, 'r', encoding='utf-8') as f:
+                self._uses_default_template = f.read() == _DEFAULT_TEMPLATE_HTML
+        
+        return self._uses_default_template
+    
+    def _render_exec_template(self, template_data):
+        """
+        Render the executive summary template by calling its compiled root function.
+        
+        Args:
+            template_data (dict): Template context
+        
+        Returns:
+            str: Rendered HTML
+        """
+        template = self._get_exec_template()
+        try:
+            return ''.join(template.root_render_func(template.new_context(template_data)))
+        except Exception:
+            # Re-raise with the template's line numbers, as Template.render does
+            self.env.handle_exception()
+    
+    def create_default_template(self, template_path):
+        """
+        Create a default HTML template for executive summaries.
+        
+        Args:
+            template_path (str): Path to save the template
+        """
+        os.makedirs(os.path.dirname(template_path), exist_ok=True)
+        Path(template_path).write_text(_DEFAULT_TEMPLATE_HTML, encoding='utf-8')
+        
         logger.info(f"Created default template at {template_path}")
     
     def generate_report(self, executive_summary, articles, output_dir, format='html'):
@@ -261,24 +677,22 @@ class ReportGenerator:
         Returns:
             str: Path to the generated report
         """
-        # Ensure output directory exists
-        os.makedirs(output_dir, exist_ok=True)
-        
-        # Generate timestamp for filename
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        # Take a single reading of the clock for the filename and report dates
+        now = datetime.now()
+        timestamp = now.strftime('%Y%m%d_%H%M%S')
         
         # Create report based on format
         if format == 'html':
-            return self.generate_html_report(executive_summary, articles, output_dir, timestamp)
+            return self.generate_html_report(executive_summary, articles, output_dir, timestamp, now)
         elif format == 'markdown':
-            return self.generate_markdown_report(executive_summary, articles, output_dir, timestamp)
+            return self.generate_markdown_report(executive_summary, articles, output_dir, timestamp, now)
         elif format == 'json':
-            return self.generate_json_report(executive_summary, articles, output_dir, timestamp)
+            return self.generate_json_report(executive_summary, articles, output_dir, timestamp, now)
         else:
             logger.warning(f"Unsupported format: {format}, defaulting to HTML")
-            return self.generate_html_report(executive_summary, articles, output_dir, timestamp)
+            return self.generate_html_report(executive_summary, articles, output_dir, timestamp, now)
     
-    def generate_html_report(self, executive_summary, articles, output_dir, timestamp):
+    def generate_html_report(self, executive_summary, articles, output_dir, timestamp, generated_at=None):
         """
         Generate an HTML report.
         
@@ -287,21 +701,26 @@ class ReportGenerator:
             articles (list): List of article dictionaries
             output_dir (str): Directory to save the report
             timestamp (str): Timestamp for the filename
+            generated_at (datetime, optional): Report generation time, defaults to now
         
         Returns:
             str: Path to the generated report
         """
+        if generated_at is None:
+            generated_at = datetime.now()
+        
         try:
-            # Convert markdown to HTML in article summaries
-            for article in articles:
-                if 'summary' in article and article['summary']:
-                    article['summary'] = markdown.markdown(article['summary'])
+            # Ensure output directory exists
+            _ensure_dir(output_dir)
+            
+            # Convert markdown to HTML in article summaries (on copies, not the caller's articles)
+            articles = _prepare_articles(articles, render_summary=True)
             
             # Prepare template data
             template_data = {
-                'title': f"PRISM Intelligence Executive Summary - {datetime.now().strftime('%B %d, %Y')}",
-                'date': datetime.now().strftime('%B %d, %Y %H:%M'),
-                'executive_summary': markdown.markdown(executive_summary.get('executive_summary', '')),
+                'title': f"PRISM Intelligence Executive Summary - {generated_at.strftime('%B %d, %Y')}",
+                'date': generated_at.strftime('%B %d, %Y %H:%M'),
+                'executive_summary': _render_md(executive_summary.get('executive_summary', '')),
                 'key_actors': executive_summary.get('key_actors', []),
                 'critical_iocs': executive_summary.get('critical_iocs', []),
                 'recommendations': executive_summary.get('recommendations', []),
@@ -340,14 +759,15 @@ class ReportGenerator:
                     "Maintain offline backups of critical data"
                 ]
             
-            # Render the template
-            template = self.env.get_template('executive_summary.html')
-            html_content = template.render(**template_data)
+            # Render the template, skipping Jinja2 when the built-in template is in use
+            if self._is_default_template():
+                html_content = _render_html_fast(template_data)
+            else:
+                html_content = self._render_exec_template(template_data)
             
             # Save the HTML report
             output_path = os.path.join(output_dir, f'prism_report_{timestamp}.html')
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            _write_report(output_path, (html_content.encode('utf-8'),))
             
             logger.info(f"Generated HTML report: {output_path}")
             return output_path
@@ -356,7 +776,7 @@ class ReportGenerator:
             logger.error(f"Error generating HTML report: {str(e)}")
             return None
     
-    def generate_markdown_report(self, executive_summary, articles, output_dir, timestamp):
+    def generate_markdown_report(self, executive_summary, articles, output_dir, timestamp, generated_at=None):
         """
         Generate a Markdown report.
         
@@ -365,71 +785,80 @@ class ReportGenerator:
             articles (list): List of article dictionaries
             output_dir (str): Directory to save the report
             timestamp (str): Timestamp for the filename
+            generated_at (datetime, optional): Report generation time, defaults to now
         
         Returns:
             str: Path to the generated report
         """
+        if generated_at is None:
+            generated_at = datetime.now()
+        
         try:
+            # Ensure output directory exists
+            _ensure_dir(output_dir)
+            
             # Build Markdown content
-            md_content = f"# PRISM Intelligence Executive Summary\n\n"
-            md_content += f"Generated: {datetime.now().strftime('%B %d, %Y %H:%M')}\n\n"
+            parts = ["# PRISM Intelligence Executive Summary\n\n"]
+            parts.append(f"Generated: {generated_at.strftime('%B %d, %Y %H:%M')}\n\n")
             
             # Executive Summary
-            md_content += "## Executive Summary\n\n"
-            md_content += executive_summary.get('executive_summary', 'No executive summary available.') + "\n\n"
+            parts.append("## Executive Summary\n\n")
+            parts.append(executive_summary.get('executive_summary', 'No executive summary available.'))
+            parts.append("\n\n")
             
             # Key Threat Actors
-            md_content += "## Key Threat Actors\n\n"
+            parts.append("## Key Threat Actors\n\n")
             key_actors = executive_summary.get('key_actors', [])
             if key_actors:
                 for actor in key_actors:
-                    md_content += f"### {actor.get('name', 'Unknown Actor')}\n\n"
-                    md_content += f"{actor.get('description', 'No description available.')}\n\n"
+                    parts.append(f"### {actor.get('name', 'Unknown Actor')}\n\n")
+                    parts.append(f"{actor.get('description', 'No description available.')}\n\n")
             else:
-                md_content += "No key threat actors identified in this reporting period.\n\n"
+                parts.append("No key threat actors identified in this reporting period.\n\n")
             
             # Critical IOCs
-            md_content += "## Critical Indicators of Compromise\n\n"
+            parts.append("## Critical Indicators of Compromise\n\n")
             critical_iocs = executive_summary.get('critical_iocs', [])
             if critical_iocs:
-                md_content += "| Type | Value | Description |\n"
-                md_content += "|------|-------|-------------|\n"
+                parts.append("| Type | Value | Description |\n")
+                parts.append("|------|-------|-------------|\n")
                 for ioc in critical_iocs:
-                    md_content += f"| {ioc.get('type', 'Unknown')} | `{ioc.get('value', 'N/A')}` | {ioc.get('description', 'No description')} |\n"
-                md_content += "\n"
+                    parts.append(f"| {ioc.get('type', 'Unknown')} | `{ioc.get('value', 'N/A')}` | {ioc.get('description', 'No description')} |\n")
+                parts.append("\n")
             else:
-                md_content += "No critical IOCs identified in this reporting period.\n\n"
+                parts.append("No critical IOCs identified in this reporting period.\n\n")
             
             # Strategic Recommendations
-            md_content += "## Strategic Recommendations\n\n"
+            parts.append("## Strategic Recommendations\n\n")
             recommendations = executive_summary.get('recommendations', [])
             if recommendations:
                 for i, rec in enumerate(recommendations, 1):
-                    md_content += f"{i}. {rec}\n"
-                md_content += "\n"
+                    parts.append(f"{i}. {rec}\n")
+                parts.append("\n")
             else:
-                md_content += "No strategic recommendations for this reporting period.\n\n"
+                parts.append("No strategic recommendations for this reporting period.\n\n")
             
             # Recent Articles
-            md_content += "## Recent Threat Intelligence\n\n"
+            parts.append("## Recent Threat Intelligence\n\n")
             if articles:
                 for article in articles:
-                    md_content += f"### [{article['title']}]({article['url']})\n\n"
-                    md_content += f"Source: {article.get('source', 'Unknown')} | {article.get('published_date', 'Unknown date')}\n\n"
-                    md_content += article.get('summary', 'No summary available.') + "\n\n"
-                    md_content += "---\n\n"
+                    parts.append(f"### [{article['title']}]({article['url']})\n\n")
+                    parts.append(f"Source: {article.get('source', 'Unknown')} | {article.get('published_date', 'Unknown date')}\n\n")
+                    parts.append(article.get('summary', 'No summary available.'))
+                    parts.append("\n\n---\n\n")
             else:
-                md_content += "No recent articles available.\n\n"
+                parts.append("No recent articles available.\n\n")
             
             # Footer
-            md_content += "---\n\n"
-            md_content += "*This report was automatically generated by PRISM - Predictive Reconnaissance & Intelligence Security Monitoring.*\n\n"
-            md_content += "**Confidential - For internal use only**\n"
+            parts.append("---\n\n")
+            parts.append("*This report was automatically generated by PRISM - Predictive Reconnaissance & Intelligence Security Monitoring.*\n\n")
+            parts.append("**Confidential - For internal use only**\n")
+            
+            md_content = ''.join(parts)
             
             # Save the Markdown report
             output_path = os.path.join(output_dir, f'prism_report_{timestamp}.md')
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(md_content)
+            _write_report(output_path, (md_content.encode('utf-8'),))
             
             logger.info(f"Generated Markdown report: {output_path}")
             return output_path
@@ -438,7 +867,7 @@ class ReportGenerator:
             logger.error(f"Error generating Markdown report: {str(e)}")
             return None
     
-    def generate_json_report(self, executive_summary, articles, output_dir, timestamp):
+    def generate_json_report(self, executive_summary, articles, output_dir, timestamp, generated_at=None):
         """
         Generate a JSON report.
         
@@ -447,31 +876,30 @@ class ReportGenerator:
             articles (list): List of article dictionaries
             output_dir (str): Directory to save the report
             timestamp (str): Timestamp for the filename
+            generated_at (datetime, optional): Report generation time, defaults to now
         
         Returns:
             str: Path to the generated report
         """
+        if generated_at is None:
+            generated_at = datetime.now()
+        
         try:
-            # Prepare report data
-            report_data = {
-                'title': f"PRISM Intelligence Executive Summary - {datetime.now().strftime('%B %d, %Y')}",
-                'generated_date': datetime.now().isoformat(),
-                'executive_summary': executive_summary,
-                'articles': [{
-                    'id': article.get('id'),
-                    'title': article.get('title'),
-                    'url': article.get('url'),
-                    'source': article.get('source'),
-                    'published_date': article.get('published_date'),
-                    'summary': article.get('summary'),
-                    'iocs': article.get('iocs', {})
-                } for article in articles]
+            # Ensure output directory exists
+            _ensure_dir(output_dir)
+            
+            # Prepare report data; articles are projected and encoded one at a
+            # time while streaming to disk
+            header = {
+                'title': f"PRISM Intelligence Executive Summary - {generated_at.strftime('%B %d, %Y')}",
+                'generated_date': generated_at.isoformat(),
+                'executive_summary': executive_summary
             }
+            projected = (_project_article(article) for article in articles)
             
             # Save the JSON report
             output_path = os.path.join(output_dir, f'prism_report_{timestamp}.json')
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(report_data, f, indent=2)
+            _write_report(output_path, _iter_json_report(header, projected))
             
             logger.info(f"Generated JSON report: {output_path}")
             return output_path
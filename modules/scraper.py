@@ -3,34 +3,675 @@ Scraper module for the CTI Aggregator.
 Handles scraping of threat intelligence from various sources.
 """
 
+import asyncio
+import codecs
+import functools
+import hashlib
+import importlib.util
+import io
+import json
 import logging
-import time
+import operator
 import random
-import requests
+import re
+import shelve
+import sys
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, asdict
+import httpx
 import feedparser
 from datetime import datetime
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer, Tag, NavigableString, CData
+import soupsieve
+from lxml import etree
 import urllib.parse
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# HTML parser used for all BeautifulSoup trees; lxml is a C parser and lets
+# BeautifulSoup sniff the encoding from the raw bytes
+_PARSER = 'lxml'
+
+# CSS selectors simple enough to express as a SoupStrainer: tag, .class, #id,
+# tag.class or tag#id
+_SIMPLE_SELECTOR_RE = re.compile(r'^([a-zA-Z][\w-]*)?(?:([.#])([\w-]+))?$')
+
+@functools.lru_cache(maxsize=None)
+def _simple_selector(selector):
+    """
+    Split a simple CSS selector into a tag name and attribute filter.
+    
+    Args:
+        selector (str): CSS selector
+        
+    Returns:
+        tuple or None: (tag name or None, attrs dict), None if the selector is too complex
+    """
+    match = _SIMPLE_SELECTOR_RE.match(selector.strip())
+    if not match or not (match.group(1) or match.group(3)):
+        return None
+    
+    tag, kind, value = match.groups()
+    attrs = {}
+    if kind == '.':
+        attrs['class'] = value
+    elif kind == '#':
+        attrs['id'] = value
+    
+    return tag, attrs
+
+@functools.lru_cache(maxsize=None)
+def _compile_css(selector):
+    """
+    Compile a CSS selector once for reuse across pages.
+    
+    Args:
+        selector (str): CSS selector
+        
+    Returns:
+        soupsieve.SoupSieve: Compiled selector
+    """
+    return soupsieve.compile(selector)
+
+def _build_strainer(selector):
+    """
+    Build a SoupStrainer equivalent to a simple CSS selector.
+    
+    Args:
+        selector (str): CSS selector
+        
+    Returns:
+        SoupStrainer or None: Strainer, or None if the selector is too complex
+    """
+    simple = _simple_selector(selector)
+    if simple is None:
+        return None
+    
+    tag, attrs = simple
+    if 'class' in attrs:
+        # The strainer sees the raw attribute value, so match the class as
+        # one of its whitespace-separated tokens
+        attrs = {'class': re.compile(r'(?:^|\s)' + re.escape(attrs['class']) + r'(?:\s|$)')}
+    return SoupStrainer(name=tag, attrs=attrs)
+
+# Elements whose contents are never article text
+_SKIP_TAGS = frozenset(('script', 'style', 'iframe', 'noscript'))
+_TEXT_TYPES = (NavigableString, CData)
+
+def _extract_text(node):
+    """
+    Collect the text of an element in one pass, skipping non-content elements.
+    
+    Equivalent to removing script/style/iframe/noscript elements and calling
+    get_text with a newline separator, without modifying the tree or walking
+    it twice.
+    
+    Args:
+        node (bs4.element.Tag): Element to extract text from
+        
+    Returns:
+        str: Text of the element, one string per line
+    """
+    parts = []
+    stack = [iter(node.children)]
+    
+    while stack:
+        for child in stack[-1]:
+            if isinstance(child, Tag):
+                if child.name not in _SKIP_TAGS:
+                    stack.append(iter(child.children))
+                    break
+            elif type(child) in _TEXT_TYPES:
+                parts.append(child)
+        else:
+            stack.pop()
+    
+    return '\n'.join(parts).strip()
+
+def _select_one(soup, selector):
+    """
+    Find the first element matching a CSS selector.
+    
+    Simple selectors use BeautifulSoup's native find instead of going
+    through the CSS engine.
+    
+    Args:
+        soup (bs4.element.Tag): Tree to search
+        selector (str): CSS selector
+        
+    Returns:
+        bs4.element.Tag or None: Matching element
+    """
+    simple = _simple_selector(selector)
+    if simple is not None:
+        tag, attrs = simple
+        return soup.find(tag, attrs)
+    return _compile_css(selector).select_one(soup)
+
+def _select(soup, selector):
+    """
+    Find all elements matching a CSS selector.
+    
+    Args:
+        soup (bs4.element.Tag): Tree to search
+        selector (str): CSS selector
+        
+    Returns:
+        list: Matching elements, in document order
+    """
+    simple = _simple_selector(selector)
+    if simple is not None:
+        tag, attrs = simple
+        return soup.find_all(tag, attrs)
+    return _compile_css(selector).select(soup)
+
+_ATOM_NS = '{http://www.w3.org/2005/Atom}'
+_CONTENT_ENCODED = '{http://purl.org/rss/1.0/modules/content/}encoded'
+_DC_CREATOR = '{http://purl.org/dc/elements/1.1/}creator'
+_RSS1_NS = '{http://purl.org/rss/1.0/}'
+_RDF_ABOUT = '{http://www.w3.org/1999/02/22-rdf-syntax-ns#}about'
+
+_get_term = operator.attrgetter('term')
+
+def _intern_tags(tags):
+    """
+    Normalize feed tags to a tuple of interned strings.
+    
+    Tags repeat across entries and feeds, so interning stores each distinct
+    tag once.
+    
+    Args:
+        tags (iterable): Tag strings
+        
+    Returns:
+        tuple: Interned tags
+    """
+    return tuple(map(sys.intern, tags))
+
+def _atom_text(element):
+    """
+    Get the text of an Atom text construct, serializing inline XHTML.
+    
+    Args:
+        element (lxml.etree._Element or None): Atom text element
+        
+    Returns:
+        str or None: Text content, None if the element is missing
+    """
+    if element is None:
+        return None
+    if len(element):
+        return ''.join(etree.tostring(child, encoding='unicode') for child in element)
+    return element.text or ''
+
+def _rss_findtext(item, tag, default=None):
+    """
+    Get the text of a child element of an RSS item, unqualified in RSS 2.0
+    and in the RSS 1.0 namespace in RSS 1.0 (RDF) feeds.
+    
+    Args:
+        item (lxml.etree._Element): RSS item
+        tag (str): Unqualified tag of the child element
+        default (str, optional): Returned if there is no such child
+        
+    Returns:
+        str or None: Text of the child element
+    """
+    text = item.findtext(tag)
+    if text is None:
+        text = item.findtext(_RSS1_NS + tag, default)
+    return text
+
+def _rss_item_link(item):
+    """
+    Get the article URL of an RSS item.
+    
+    Falls back to a permalink <guid>, then to the rdf:about attribute of an
+    RSS 1.0 item, when there is no <link>.
+    
+    Args:
+        item (lxml.etree._Element): RSS item
+        
+    Returns:
+        str: Article URL, empty if the item has none
+    """
+    link = _rss_findtext(item, 'link', '').strip()
+    if link:
+        return link
+    
+    guid = item.find('guid')
+    if guid is not None and guid.get('isPermaLink', 'true') == 'true' and guid.text:
+        return guid.text.strip()
+    
+    return item.get(_RDF_ABOUT, '')
+
+def _rss_item_to_entry(item):
+    """
+    Build a minimal entry dictionary from an RSS 2.0 or RSS 1.0 <item> element.
+    
+    Args:
+        item (lxml.etree._Element): RSS item
+        
+    Returns:
+        dict: Feed entry
+    """
+    return {
+        'title': _rss_findtext(item, 'title', ''),
+        'link': _rss_item_link(item),
+        'author': item.findtext('author') or item.findtext(_DC_CREATOR, ''),
+        'published': item.findtext('pubDate') or item.findtext('{*}date', ''),
+        'tags': _intern_tags(category.text for category in item.iterfind('category') if category.text),
+        'content': item.findtext(_CONTENT_ENCODED),
+        'summary': _rss_findtext(item, 'description')
+    }
+
+def _atom_entry_to_entry(entry):
+    """
+    Build a minimal entry dictionary from an Atom <entry> element.
+    
+    Args:
+        entry (lxml.etree._Element): Atom entry
+        
+    Returns:
+        dict: Feed entry
+    """
+    link = ''
+    for link_element in entry.iterfind(_ATOM_NS + 'link'):
+        if link_element.get('rel', 'alternate') == 'alternate':
+            link = link_element.get('href', '')
+            break
+    
+    return {
+        'title': _atom_text(entry.find(_ATOM_NS + 'title')) or '',
+        'link': link,
+        'author': entry.findtext(f'{_ATOM_NS}author/{_ATOM_NS}name', ''),
+        'published': entry.findtext(_ATOM_NS + 'published') or entry.findtext(_ATOM_NS + 'updated', ''),
+        'tags': _intern_tags(category.get('term') for category in entry.iterfind(_ATOM_NS + 'category') if category.get('term')),
+        'content': _atom_text(entry.find(_ATOM_NS + 'content')),
+        'summary': _atom_text(entry.find(_ATOM_NS + 'summary'))
+    }
+
+def _iterparse_items(body, tag, to_entry):
+    """
+    Stream the items out of a feed document.
+    
+    Each item is converted to a dictionary as soon as it has been parsed and
+    then freed, so large feeds never exist as a full tree in memory.
+    
+    Args:
+        body (bytes): Raw feed document
+        tag (str): Tag of the item elements
+        to_entry (callable): Converts an item element to an entry dictionary
+        
+    Returns:
+        list: List of entry dictionaries
+    """
+    entries = []
+    context = etree.iterparse(io.BytesIO(body), events=('end',), tag=tag, resolve_entities=False)
+    
+    for _, element in context:
+        entries.append(to_entry(element))
+        
+        # Free the item and any already processed siblings
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+    
+    return entries
+
+def _parse_rss2_lxml(body):
+    """
+    Parse the items of an RSS 2.0 (or RSS 1.0) feed.
+    
+    Args:
+        body (bytes): Raw feed document
+        
+    Returns:
+        list: List of entry dictionaries
+    """
+    return _iterparse_items(body, '{*}item', _rss_item_to_entry)
+
+def _parse_atom_lxml(body):
+    """
+    Parse the entries of an Atom feed.
+    
+    Args:
+        body (bytes): Raw feed document
+        
+    Returns:
+        list: List of entry dictionaries
+    """
+    return _iterparse_items(body, _ATOM_NS + 'entry', _atom_entry_to_entry)
+
+def _parse_jsonfeed(body):
+    """
+    Parse the items of a JSON Feed.
+    
+    Args:
+        body (bytes): Raw feed document
+        
+    Returns:
+        list: List of entry dictionaries
+    """
+    feed = orjson.loads(body) if orjson is not None else json.loads(body)
+    entries = []
+    
+    for item in feed.get('items', []):
+        # JSON Feed 1.1 uses an authors list, 1.0 a single author
+        authors = item.get('authors') or ([item['author']] if item.get('author') else [])
+        content = item.get('content_html')
+        if content is None:
+            content = item.get('content_text')
+        
+        entries.append({
+            'title': item.get('title', ''),
+            'link': item.get('url') or item.get('external_url', ''),
+            'author': ', '.join(author.get('name', '') for author in authors),
+            'published': item.get('date_published', ''),
+            'tags': _intern_tags(item.get('tags') or ()),
+            'content': content,
+            'summary': item.get('summary')
+        })
+    
+    return entries
+
+_FEED_PARSERS = {
+    'rss2': _parse_rss2_lxml,
+    'atom': _parse_atom_lxml,
+    'jsonfeed': _parse_jsonfeed
+}
+
+def sniff_feed_format(body):
+    """
+    Classify a feed document from its first few bytes.
+    
+    Args:
+        body (bytes): Raw feed document
+        
+    Returns:
+        str: 'jsonfeed', 'atom' or 'rss2'
+    """
+    head = body[:256].lstrip(b'\xef\xbb\xbf \t\r\n')
+    if head.startswith(b'{'):
+        return 'jsonfeed'
+    if b'<feed' in head:
+        return 'atom'
+    return 'rss2'
+
+def _feedparser_entries(body):
+    """
+    Parse a feed with feedparser into the same entry dictionaries as the lxml parsers.
+    
+    Slower, but tolerant of malformed documents.
+    
+    Args:
+        body (bytes): Raw feed document
+        
+    Returns:
+        list: List of entry dictionaries
+    """
+    return [
+        {
+            'title': entry.get('title', ''),
+            'link': entry.get('link', ''),
+            'author': entry.get('author', ''),
+            'published': entry.get('published', ''),
+            'tags': _intern_tags(map(_get_term, entry.get('tags') or ())),
+            'content': entry.content[0].value if 'content' in entry else None,
+            'summary': entry.get('summary')
+        }
+        for entry in feedparser.parse(body).entries
+    ]
+
+def parse_feed(body, feed_format=None):
+    """
+    Parse the entries of an RSS, Atom or JSON feed.
+    
+    Args:
+        body (bytes): Raw feed document
+        feed_format (str, optional): 'rss2', 'atom' or 'jsonfeed'; sniffed
+            from the document if not given
+        
+    Returns:
+        list: List of entry dictionaries with title, link, author, published,
+            tags, content and summary keys (content and summary may be None)
+    """
+    if feed_format is None:
+        feed_format = sniff_feed_format(body)
+    
+    parser = _FEED_PARSERS.get(feed_format)
+    if parser is None:
+        logger.warning(f"Unknown feed format: {feed_format}")
+    else:
+        try:
+            entries = parser(body)
+            # Entries without links mean the document wasn't understood
+            if feed_format == 'jsonfeed' or (entries and all(entry['link'] for entry in entries)):
+                return entries
+        except (etree.LxmlError, ValueError, AttributeError) as e:
+            logger.debug(f"Failed to parse {feed_format} feed: {str(e)}")
+    
+    # Fall back to feedparser's format detection for malformed or mislabeled XML feeds
+    return _feedparser_entries(body)
+
+def _compile_substrings(patterns):
+    """
+    Compile a list of substrings into one regex matching any of them.
+    
+    Args:
+        patterns (list or None): Substrings to match
+        
+    Returns:
+        re.Pattern or None: Compiled alternation, None if no list was given
+    """
+    if patterns is None:
+        return None
+    if not patterns:
+        # An empty list matches nothing
+        return re.compile(r'(?!)')
+    return re.compile('|'.join(map(re.escape, patterns)))
+
+def _response_charset(response):
+    """
+    Get the charset declared in a response's Content-Type header.
+    
+    This never guesses: without a declared charset the parser sniffs the
+    encoding from the bytes itself.
+    
+    Args:
+        response (Page): HTTP response
+        
+    Returns:
+        str or None: Declared charset, None if missing or unknown
+    """
+    for param in response.headers.get('Content-Type', '').split(';')[1:]:
+        key, _, value = param.partition('=')
+        if key.strip().lower() == 'charset':
+            charset = value.strip().strip('"\'')
+            try:
+                return codecs.lookup(charset).name
+            except LookupError:
+                return None
+    return None
+
+# Error statuses retried by make_request, with exponential backoff
+_RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+_MAX_RETRIES = 3
+_BACKOFF_FACTOR = 0.3
+
+# URLs whose server asks to wait longer than this (seconds) are given up on
+# rather than holding a fetch worker and the host's request slot
+_MAX_RETRY_AFTER = 60
+
+class _HostLimiter:
+    """Limits concurrency and spaces out the start of requests to one host"""
+    
+    def __init__(self, max_concurrency):
+        """
+        Initialize the limiter.
+        
+        Args:
+            max_concurrency (int): Maximum number of concurrent requests
+        """
+        self.semaphore = threading.BoundedSemaphore(max_concurrency)
+        self._lock = threading.Lock()
+        self._next_request = 0.0
+    
+    def wait(self, min_interval):
+        """
+        Reserve the next request slot and sleep until it starts.
+        
+        Args:
+            min_interval (float): Minimum seconds between request starts
+        """
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_request)
+            self._next_request = start + min_interval
+        
+        if start > now:
+            time.sleep(start - now)
+
+@dataclass(slots=True)
+class Article:
+    """A scraped article"""
+    
+    source: str
+    title: str
+    url: str
+    author: str = ''
+    published_date: str = ''
+    tags: tuple = ()
+    content: str = ''
+    iocs: dict = None
+    
+    def to_dict(self):
+        """
+        Convert the article to a dictionary, e.g. for DatabaseManager.store_article.
+        
+        Returns:
+            dict: Article data
+        """
+        return asdict(self)
+
+# Headers and body of a successful response, as returned by make_request
+Page = namedtuple('Page', ['headers', 'content'])
+
+# Feed summaries shorter than this are replaced by the full article
+_DEFAULT_MIN_CONTENT_LENGTH = 1000
+
+def _noop(article):
+    """Post-processor for sources without source-specific processing."""
+
+# Default tags for Volexity articles
+_VOLEXITY_TAGS = ('volexity', 'threat-research')
+
+# HTTP cache key prefix for article text, stored alongside each URL's validators
+_CONTENT_KEY_PREFIX = 'text:'
+
+# Returned by make_request when the resource hasn't changed since the last fetch
+NOT_MODIFIED = object()
+
 class ThreatIntelScraper:
     """Scrapes threat intelligence from various sources"""
     
-    def __init__(self, sources_config):
+    def __init__(self, sources_config, http_cache_path=None, seen_urls=None,
+                 fetch_workers=8, per_host_limit=4, min_request_interval=0.25,
+                 max_response_bytes=5 * 1024 * 1024):
         """
         Initialize the scraper with source configurations.
         
         Args:
             sources_config (list): List of source configurations
+            http_cache_path (str, optional): File to persist HTTP validators in
+                between runs; kept in memory only if not given
+            seen_urls (iterable, optional): URLs of articles already ingested,
+                which are skipped without being fetched
+            fetch_workers (int): Number of articles of a source fetched in parallel
+            per_host_limit (int): Maximum number of concurrent requests per host
+            min_request_interval (float): Default minimum seconds between requests
+                to the same host, overridable per source
+            max_response_bytes (int): Size above which responses are abandoned
         """
         self.sources = sources_config
-        self.user_agents = [
+        self.fetch_workers = fetch_workers
+        self.per_host_limit = per_host_limit
+        self.min_request_interval = min_request_interval
+        self.max_response_bytes = max_response_bytes
+        
+        # Limit and space out requests to each host to stay polite
+        self._host_limiters = {}
+        self._host_limiters_lock = threading.Lock()
+        
+        # Already ingested article URLs, shared by all sources so that articles
+        # appearing in several feeds are only fetched once
+        self.seen_urls = set(seen_urls or ())
+        self._seen_urls_lock = threading.Lock()
+        self.user_agents = (
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.0 Safari/605.1.15',
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:90.0) Gecko/20100101 Firefox/90.0',
             'Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:90.0) Gecko/20100101 Firefox/90.0'
-        ]
+        )
+        
+        # Shared client so repeated requests to a host reuse pooled keep-alive
+        # connections, multiplexed over HTTP/2 when the h2 package is installed.
+        # The transport retries failed connection attempts; make_request
+        # retries transient error statuses. The user agent is picked once per
+        # run rather than per request, so servers and CDNs see a consistent
+        # client on reused connections
+        transport = httpx.HTTPTransport(
+            http2=importlib.util.find_spec('h2') is not None,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            retries=3
+        )
+        self.client = httpx.Client(
+            transport=transport,
+            timeout=30.0,
+            follow_redirects=True,
+            headers={'User-Agent': self.get_random_user_agent()}
+        )
+        
+        # ETag, Last-Modified and body hash per URL, used for conditional
+        # requests, plus the article text extracted from each body
+        self._http_cache = shelve.open(http_cache_path) if http_cache_path else {}
+        self._http_cache_lock = threading.Lock()
+        
+        # Source-specific processing of scraped feed articles, by source name
+        self._post_processors = {
+            'Volexity Blog': self._postprocess_volexity
+        }
+        
+        # Default min_content_length by source name; Volexity's feed truncates
+        # every post, so its articles are always fetched in full
+        self._min_content_lengths = {
+            'Volexity Blog': sys.maxsize
+        }
+    
+    def close(self):
+        """Close the underlying HTTP client and persist the HTTP cache."""
+        self.client.close()
+        if isinstance(self._http_cache, shelve.Shelf):
+            self._http_cache.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def get_random_user_agent(self):
         """
@@ -41,60 +682,235 @@ class ThreatIntelScraper:
         """
         return random.choice(self.user_agents)
     
-    def make_request(self, url, headers=None):
+    def make_request(self, url, headers=None, min_interval=None, conditional=True):
         """
-        Make a request to a URL with proper error handling.
+        Make a conditional request to a URL with proper error handling.
+        
+        Validators from the previous fetch of the URL are sent along, and a
+        resource whose body is unchanged is reported as not modified even if
+        the server ignores them.
         
         Args:
             url (str): URL to request
-            headers (dict, optional): HTTP headers
+            headers (dict, optional): HTTP headers on top of the client defaults
+            min_interval (float, optional): Minimum seconds between requests to
+                the URL's host, defaults to min_request_interval
+            conditional (bool): Use and remember validators; feeds and listing
+                pages are always fetched in full, since articles that failed
+                last time must be retried even if the page hasn't changed
             
         Returns:
-            requests.Response or None: Response object if successful, None otherwise
+            Page, NOT_MODIFIED or None: Response headers and body if successful,
+                NOT_MODIFIED if unchanged since the last fetch, None otherwise
         """
-        if not headers:
-            headers = {'User-Agent': self.get_random_user_agent()}
+        if min_interval is None:
+            min_interval = self.min_request_interval
+        
+        cached = None
+        if conditional:
+            with self._http_cache_lock:
+                cached = self._http_cache.get(url)
+        
+        if cached:
+            etag, last_modified, _ = cached
+            headers = dict(headers) if headers else {}
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
             
         try:
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            return response
-        except requests.RequestException as e:
+            limiter = self.get_host_limiter(url)
+            
+            for attempt in range(_MAX_RETRIES + 1):
+                with limiter.semaphore:
+                    limiter.wait(min_interval)
+                    
+                    with self.client.stream('GET', url, headers=headers) as response:
+                        status_code = response.status_code
+                        
+                        if status_code not in _RETRY_STATUSES or attempt == _MAX_RETRIES:
+                            if status_code == 304:
+                                logger.debug(f"Not modified: {url}")
+                                return NOT_MODIFIED
+                            
+                            response.raise_for_status()
+                            
+                            content = self.read_body(url, response)
+                            if content is None:
+                                return None
+                            
+                            page = Page(response.headers, content)
+                            break
+                        
+                        retry_after = response.headers.get('Retry-After', '')
+                
+                # Back off before retrying, honouring the server's Retry-After
+                delay = _BACKOFF_FACTOR * 2 ** attempt
+                if retry_after.isdigit():
+                    if int(retry_after) > _MAX_RETRY_AFTER:
+                        logger.warning(f"Giving up on {url}: server asks to retry after {retry_after}s")
+                        return None
+                    delay = max(delay, int(retry_after))
+                logger.debug(f"Retrying {url} in {delay:.1f}s after HTTP {status_code}")
+                time.sleep(delay)
+        except httpx.HTTPError as e:
             logger.error(f"Request error for {url}: {str(e)}")
             return None
+        
+        if not conditional:
+            return page
+        
+        body_hash = hashlib.blake2b(page.content, digest_size=16).digest()
+        with self._http_cache_lock:
+            self._http_cache[url] = (
+                page.headers.get('ETag'),
+                page.headers.get('Last-Modified'),
+                body_hash
+            )
+        
+        if cached and cached[2] == body_hash:
+            logger.debug(f"Content unchanged: {url}")
+            return NOT_MODIFIED
+        
+        return page
+    
+    def read_body(self, url, response):
+        """
+        Read the body of a streamed response, refusing unusable content.
+        
+        Responses that aren't text, markup or JSON (e.g. PDFs and images), or
+        that are larger than max_response_bytes, are abandoned without
+        downloading the rest of the body.
+        
+        Args:
+            url (str): Requested URL
+            response (httpx.Response): Streamed response
+            
+        Returns:
+            bytes or None: Response body, None if it was refused
+        """
+        content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+        if content_type and not (content_type.startswith('text/') or content_type.endswith(('xml', 'json'))):
+            logger.warning(f"Skipping {url}: unsupported content type {content_type}")
+            return None
+        
+        content_length = response.headers.get('Content-Length', '')
+        if content_length.isdigit() and int(content_length) > self.max_response_bytes:
+            logger.warning(f"Skipping {url}: {content_length} bytes exceeds the size limit")
+            return None
+        
+        chunks = []
+        size = 0
+        for chunk in response.iter_bytes(65536):
+            size += len(chunk)
+            if size > self.max_response_bytes:
+                logger.warning(f"Skipping {url}: body exceeds the size limit")
+                return None
+            chunks.append(chunk)
+        
+        return b''.join(chunks)
+    
+    def get_host_limiter(self, url):
+        """
+        Get the limiter for requests to a URL's host.
+        
+        Args:
+            url (str): URL to request
+            
+        Returns:
+            _HostLimiter: Limiter for the host
+        """
+        host = urllib.parse.urlsplit(url).netloc
+        
+        with self._host_limiters_lock:
+            limiter = self._host_limiters.get(host)
+            if limiter is None:
+                limiter = _HostLimiter(self.per_host_limit)
+                self._host_limiters[host] = limiter
+        
+        return limiter
     
     def scrape_all_sources(self):
         """
         Scrape all configured sources.
         
         Returns:
-            dict: Dictionary of articles by source
+            dict: Dictionary of Article objects by source
                 {
                     'source_name': [article1, article2, ...],
                     ...
                 }
         """
-        results = {}
+        return asyncio.run(self.ascrape_all_sources())
+    
+    async def ascrape_all_sources(self, max_concurrency=4):
+        """
+        Scrape all configured sources concurrently.
         
-        for source in self.sources:
-            source_name = source['name']
-            logger.info(f"Scraping source: {source_name}")
-            
-            # Determine scraping method based on source type
-            if source['type'] == 'rss':
-                articles = self.scrape_rss_feed(source)
-            elif source['type'] == 'web':
-                articles = self.scrape_web_page(source)
-            else:
-                logger.warning(f"Unsupported source type: {source['type']}")
-                continue
-            
-            results[source_name] = articles
+        Each source is scraped in a worker thread, so network waits for
+        different sources overlap while sharing the pooled HTTP client.
+        Politeness is enforced per host by make_request.
+        
+        Args:
+            max_concurrency (int): Maximum number of sources scraped at once
+        
+        Returns:
+            dict: Dictionary of articles by source, in configuration order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def scrape(source):
+            async with semaphore:
+                return await asyncio.to_thread(self.scrape_source, source)
+        
+        scraped = await asyncio.gather(*(scrape(source) for source in self.sources))
+        
+        return {
+            source['name']: articles
+            for source, articles in zip(self.sources, scraped)
+            if articles is not None
+        }
+    
+    def iter_scrape_all_sources(self, max_concurrency=4):
+        """
+        Scrape all configured sources concurrently, yielding each source's
+        articles as soon as it's done.
+        
+        The caller can process a finished source (IOC extraction, storage)
+        while the remaining sources are still being scraped in worker threads.
+        
+        Args:
+            max_concurrency (int): Maximum number of sources scraped at once
+        
+        Yields:
+            tuple: Source name and its list of Article objects, in completion order
+        """
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            futures = {executor.submit(self.scrape_source, source): source for source in self.sources}
+            for future in as_completed(futures):
+                articles = future.result()
+                if articles is not None:
+                    yield futures[future]['name'], articles
+    
+    def scrape_source(self, source):
+        """
+        Scrape a single source using the method for its type.
+        
+        Args:
+            source (dict): Source configuration
             
-            # Be nice to the servers
-            time.sleep(random.uniform(1, 3))
+        Returns:
+            list or None: List of Article objects, None if the source type is unsupported
+        """
+        logger.info(f"Scraping source: {source['name']}")
+        if source['type'] == 'rss':
+            return self.scrape_rss_feed(source)
+        elif source['type'] == 'web':
+            return self.scrape_web_page(source)
         
-        return results
+        logger.warning(f"Unsupported source type: {source['type']}")
+        return None
     
     def scrape_rss_feed(self, source_config):
         """
@@ -104,61 +920,97 @@ class ThreatIntelScraper:
             source_config (dict): Source configuration
             
         Returns:
-            list: List of article dictionaries
+            list: List of Article objects
         """
         articles = []
         
         try:
             feed_url = source_config['feed_url']
-            feed = feedparser.parse(feed_url)
+            # Already ingested entries are skipped through seen_urls
+            response = self.make_request(
+                feed_url, min_interval=source_config.get('min_request_interval'), conditional=False
+            )
+            
+            if not response:
+                return articles
             
-            if not feed.entries:
+            entries = parse_feed(response.content, source_config.get('feed_format'))
+            
+            if not entries:
                 logger.warning(f"No entries found in feed: {feed_url}")
                 return articles
             
-            logger.info(f"Found {len(feed.entries)} entries in feed: {feed_url}")
+            logger.info(f"Found {len(entries)} entries in feed: {feed_url}")
+            
+            # Source-specific settings, looked up once per feed. Summaries
+            # shorter than min_content_length are replaced by the full article
+            name = source_config['name']
+            post_process = self._post_processors.get(name, _noop)
+            min_content_length = source_config.get(
+                'min_content_length',
+                self._min_content_lengths.get(name, _DEFAULT_MIN_CONTENT_LENGTH)
+            )
+            
+            # Articles whose full content has to be fetched from the site
+            to_fetch = []
             
-            for entry in feed.entries:
+            for entry in entries:
+                # Skip articles that were already ingested
+                if not self.claim_url(entry['link']):
+                    continue
+                
                 # Extract basic info from feed
-                article = {
-                    'source': source_config['name'],
-                    'title': entry.title,
-                    'url': entry.link,
-                    'author': entry.get('author', ''),
-                    'published_date': entry.get('published', ''),
-                    'tags': [tag.term for tag in entry.get('tags', [])] if hasattr(entry, 'tags') else []
-                }
+                article = Article(
+                    source=source_config['name'],
+                    title=entry['title'],
+                    url=entry['link'],
+                    author=entry['author'],
+                    published_date=entry['published'],
+                    tags=entry['tags']
+                )
                 
                 # Get full content
-                if 'content' in entry:
+                if entry['content'] is not None:
                     # Some feeds include full content
-                    article['content'] = entry.content[0].value
-                elif hasattr(entry, 'summary'):
+                    article.content = entry['content']
+                elif entry['summary'] is not None:
                     # Some feeds include summaries that might contain partial content
-                    article['content'] = entry.summary
+                    article.content = entry['summary']
                     
-                    # For feeds like Volexity that might truncate content, fetch the full article
-                    if source_config['name'] == 'Volexity Blog' or len(article['content']) < 1000:
-                        full_content = self.fetch_article_content(article['url'], source_config)
-                        if full_content:
-                            article['content'] = full_content
+                    # For feeds that might truncate content, fetch the full article
+                    if len(article.content) < min_content_length:
+                        to_fetch.append(article)
                 else:
                     # Otherwise fetch the full article
-                    article['content'] = self.fetch_article_content(article['url'], source_config)
+                    to_fetch.append(article)
                 
-                # For Volexity specifically, enhance with source-specific processing
-                if source_config['name'] == 'Volexity Blog':
-                    # Add common tags for Volexity articles
-                    if 'tags' not in article or not article['tags']:
-                        article['tags'] = ['volexity', 'threat-research']
+                # Enhance with source-specific processing
+                post_process(article)
                 
                 articles.append(article)
             
+            # Fetch full articles in parallel, keeping the feed content if a fetch fails
+            contents = self.fetch_articles_content([article.url for article in to_fetch], source_config)
+            for article, full_content in zip(to_fetch, contents):
+                if full_content:
+                    article.content = full_content
+            
         except Exception as e:
             logger.error(f"Error scraping RSS feed {source_config['feed_url']}: {str(e)}")
         
         return articles
     
+    def _postprocess_volexity(self, article):
+        """
+        Apply Volexity-specific processing to a scraped article.
+        
+        Args:
+            article (Article): Scraped article
+        """
+        # Add common tags for Volexity articles
+        if not article.tags:
+            article.tags = _VOLEXITY_TAGS
+    
     def scrape_web_page(self, source_config):
         """
         Scrape articles from a web page.
@@ -167,26 +1019,22 @@ class ThreatIntelScraper:
             source_config (dict): Source configuration
             
         Returns:
-            list: List of article dictionaries
+            list: List of Article objects
         """
         articles = []
         
         try:
             url = source_config['url']
-            response = self.make_request(url)
+            # Already ingested articles are skipped through seen_urls
+            response = self.make_request(
+                url, min_interval=source_config.get('min_request_interval'), conditional=False
+            )
             
             if not response:
                 return articles
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Extract article links based on source-specific selectors
-            article_selector = source_config.get('article_selector', 'a')
-            article_links = soup.select(article_selector)
-            
-            for link in article_links:
-                href = link.get('href')
-                
+            candidates = []
+            for href, title in self.extract_links(response.content, source_config, _response_charset(response)):
                 if not href:
                     continue
                 
@@ -198,21 +1046,26 @@ class ThreatIntelScraper:
                 if not self.is_article_url(href, source_config):
                     continue
                 
-                # Basic article info
-                article = {
-                    'source': source_config['name'],
-                    'title': link.text.strip() if link.text else 'Unknown Title',
-                    'url': href,
-                    'tags': []
-                }
-                
-                # Fetch full article content
-                article['content'] = self.fetch_article_content(href, source_config)
+                # Skip articles that were already ingested
+                if not self.claim_url(href):
+                    continue
                 
+                # Basic article info
+                candidates.append(Article(
+                    source=source_config['name'],
+                    title=title or 'Unknown Title',
+                    url=href
+                ))
+            
+            # Fetch full article content in parallel
+            contents = self.fetch_articles_content([article.url for article in candidates], source_config)
+            
+            for article, content in zip(candidates, contents):
                 # Skip if no content was retrieved
-                if not article['content']:
+                if not content:
                     continue
                 
+                article.content = content
                 articles.append(article)
             
         except Exception as e:
@@ -220,6 +1073,23 @@ class ThreatIntelScraper:
         
         return articles
     
+    def fetch_articles_content(self, urls, source_config):
+        """
+        Fetch the full content of several articles in parallel.
+        
+        Args:
+            urls (list): Article URLs
+            source_config (dict): Source configuration
+            
+        Returns:
+            list: Article contents in the order of urls, empty strings for failures
+        """
+        if not urls:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(self.fetch_workers, len(urls))) as executor:
+            return list(executor.map(lambda url: self.fetch_article_content(url, source_config), urls))
+    
     def fetch_article_content(self, url, source_config):
         """
         Fetch the full content of an article.
@@ -232,31 +1102,196 @@ class ThreatIntelScraper:
             str: Article content or empty string if failed
         """
         try:
-            response = self.make_request(url)
+            response = self.make_request(url, min_interval=source_config.get('min_request_interval'))
+            content_selector = source_config.get('content_selector', 'article')
+            
+            # Reuse the text extracted the last time an unchanged page was
+            # fetched, or fetch it again in full if there is none (e.g. the
+            # selector changed or the last extraction failed)
+            if response is NOT_MODIFIED:
+                content = self.get_cached_content(url, content_selector)
+                if content is not None:
+                    return content
+                response = self.make_request(
+                    url, min_interval=source_config.get('min_request_interval'), conditional=False
+                )
             
             if not response:
                 return ""
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            content = self.extract_content(response.content, source_config, _response_charset(response))
             
-            # Extract content based on source-specific content selector
-            content_selector = source_config.get('content_selector', 'article')
-            content_element = soup.select_one(content_selector)
-            
-            if not content_element:
+            if content is None:
                 logger.warning(f"Content element not found for {url}")
                 return ""
             
-            # Remove script, style, and iframe elements
-            for element in content_element.select('script, style, iframe'):
-                element.decompose()
-            
-            return content_element.get_text(separator='\n').strip()
+            self.cache_content(url, content_selector, content)
+            return content
             
         except Exception as e:
             logger.error(f"Error fetching article content from {url}: {str(e)}")
             return ""
     
+    def get_cached_content(self, url, content_selector):
+        """
+        Get the article text extracted from the current version of a page.
+        
+        Args:
+            url (str): Article URL
+            content_selector (str): CSS selector the text was extracted with
+            
+        Returns:
+            str or None: Cached article text, None if not cached or stale
+        """
+        with self._http_cache_lock:
+            validators = self._http_cache.get(url)
+            cached = self._http_cache.get(_CONTENT_KEY_PREFIX + url)
+        
+        # Only valid for the body last fetched and the same selector
+        if validators and cached and cached[:2] == (validators[2], content_selector):
+            return cached[2]
+        return None
+    
+    def cache_content(self, url, content_selector, content):
+        """
+        Remember the article text extracted from the last fetched version of a page.
+        
+        Args:
+            url (str): Article URL
+            content_selector (str): CSS selector the text was extracted with
+            content (str): Article text
+        """
+        with self._http_cache_lock:
+            validators = self._http_cache.get(url)
+            if validators:
+                self._http_cache[_CONTENT_KEY_PREFIX + url] = (validators[2], content_selector, content)
+    
+    def extract_links(self, body, source_config, encoding=None):
+        """
+        Extract candidate article links from a listing page.
+        
+        Uses selectolax's lexbor parser when installed, BeautifulSoup otherwise.
+        
+        Args:
+            body (bytes): Raw HTML document
+            source_config (dict): Source configuration
+            encoding (str, optional): Charset declared by the server; sniffed
+                from the document if not given
+            
+        Returns:
+            list: List of (href, title) tuples, in document order
+        """
+        article_selector = source_config.get('article_selector', 'a')
+        
+        if LexborHTMLParser is not None:
+            tree = LexborHTMLParser(body.decode(encoding, errors='replace') if encoding else body)
+            return [
+                (node.attributes.get('href'), (node.text() or '').strip())
+                for node in tree.css(article_selector)
+            ]
+        
+        # Only build tree nodes for candidate links when the selector allows
+        strainer = self.get_strainer(source_config, '_link_strainer', article_selector)
+        soup = BeautifulSoup(body, _PARSER, parse_only=strainer, from_encoding=encoding)
+        return [
+            (link.get('href'), link.text.strip() if link.text else '')
+            for link in _select(soup, article_selector)
+        ]
+    
+    def extract_content(self, body, source_config, encoding=None):
+        """
+        Extract the article text from a page.
+        
+        Uses selectolax's lexbor parser when installed, BeautifulSoup otherwise.
+        
+        Args:
+            body (bytes): Raw HTML document
+            source_config (dict): Source configuration
+            encoding (str, optional): Charset declared by the server; sniffed
+                from the document if not given
+            
+        Returns:
+            str or None: Article text, None if the content element wasn't found
+        """
+        content_selector = source_config.get('content_selector', 'article')
+        
+        if LexborHTMLParser is not None:
+            tree = LexborHTMLParser(body.decode(encoding, errors='replace') if encoding else body)
+            node = tree.css_first(content_selector)
+            if node is None:
+                return None
+            
+            # Remove script, style, iframe and noscript elements
+            for element in node.css('script, style, iframe, noscript'):
+                element.decompose()
+            
+            return node.text(separator='\n').strip()
+        
+        # Only build the tree for the content container when possible
+        strainer = self.get_strainer(source_config, '_strainer', content_selector)
+        soup = BeautifulSoup(body, _PARSER, parse_only=strainer, from_encoding=encoding)
+        content_element = _select_one(soup, content_selector)
+        
+        if not content_element and strainer is not None:
+            # Fall back to parsing the whole document
+            soup = BeautifulSoup(body, _PARSER, from_encoding=encoding)
+            content_element = _select_one(soup, content_selector)
+        
+        if not content_element:
+            return None
+        
+        return _extract_text(content_element)
+    
+    def claim_url(self, url):
+        """
+        Mark an article URL as seen.
+        
+        Args:
+            url (str): Article URL
+            
+        Returns:
+            bool: True if the URL wasn't seen before, False otherwise
+        """
+        with self._seen_urls_lock:
+            if url in self.seen_urls:
+                return False
+            self.seen_urls.add(url)
+            return True
+    
+    def get_strainer(self, source_config, key, selector):
+        """
+        Get the SoupStrainer for a selector, cached on the source configuration.
+        
+        Args:
+            source_config (dict): Source configuration
+            key (str): Cache key in the source configuration
+            selector (str): CSS selector
+            
+        Returns:
+            SoupStrainer or None: Strainer, or None if the selector is too complex
+        """
+        if key not in source_config:
+            source_config[key] = _build_strainer(selector)
+        return source_config[key]
+    
+    def get_url_matcher(self, source_config):
+        """
+        Get the URL include and exclude patterns as single compiled regexes.
+        
+        The patterns are plain substrings; each list is compiled once into an
+        escaped alternation and cached on the source configuration.
+        
+        Args:
+            source_config (dict): Source configuration
+            
+        Returns:
+            tuple: (include regex or None, exclude regex or None)
+        """
+        if '_include_re' not in source_config:
+            source_config['_include_re'] = _compile_substrings(source_config.get('url_include_patterns'))
+            source_config['_exclude_re'] = _compile_substrings(source_config.get('url_exclude_patterns'))
+        return source_config['_include_re'], source_config['_exclude_re']
+    
     def is_article_url(self, url, source_config):
         """
         Check if a URL is likely to be an article.
@@ -268,13 +1303,15 @@ class ThreatIntelScraper:
         Returns:
             bool: True if URL is likely an article, False otherwise
         """
+        include_re, exclude_re = self.get_url_matcher(source_config)
+        
         # Check if URL matches any include patterns
-        if 'url_include_patterns' in source_config:
-            return any(pattern in url for pattern in source_config['url_include_patterns'])
+        if include_re is not None:
+            return include_re.search(url) is not None
         
         # Check if URL matches any exclude patterns
-        if 'url_exclude_patterns' in source_config:
-            return not any(pattern in url for pattern in source_config['url_exclude_patterns'])
+        if exclude_re is not None:
+            return exclude_re.search(url) is None
         
         # Default to assuming it's an article
         return True
@@ -3,61 +3,34 @@ Summarizer module for PRISM.
 Handles AI-powered summarization of threat intelligence articles.
 """
 
+import asyncio
+import functools
+import importlib.util
 import logging
 import json
+import random
 import re
+import threading
+import time
+import weakref
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 import anthropic
+import httpx
+import json_repair
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from modules.context_gate import compress
+from modules.llm_cache import LLMCache, cache_key
 
 logger = logging.getLogger(__name__)
 
-class ArticleSummarizer:
-    """Generates summaries for individual threat intelligence articles"""
-    
-    def __init__(self, api_key, model="claude-3-opus-20240229"):
-        """
-        Initialize the article summarizer.
-        
-        Args:
-            api_key (str): Claude AI API key
-            model (str): Claude model to use
-        """
-        self.api_key = api_key
-        self.model = model
-        self.client = anthropic.Anthropic(api_key=api_key)
-    
-    def summarize(self, title, content, iocs=None):
-        """
-        Generate a summary for an article using Claude AI.
-        
-        Args:
-            title (str): Article title
-            content (str): Article content
-            iocs (dict, optional): Extracted IOCs
-        
-        Returns:
-            str: Generated summary
-        """
-        try:
-            # Prepare IOCs section if available
-            iocs_text = ""
-            if iocs:
-                iocs_text = "Extracted Indicators of Compromise (IOCs):\n"
-                for ioc_type, ioc_list in iocs.items():
-                    iocs_text += f"\n{ioc_type.upper()}:\n"
-                    for ioc in ioc_list:
-                        iocs_text += f"- {ioc['value']}"
-                        if ioc.get('context'):
-                            iocs_text += f" (Context: {ioc['context']})"
-                        iocs_text += "\n"
-            
-            # Check for source-specific customization
-            if "Volexity" in title or "volexity" in title.lower():
-                source_type = "Volexity"
-            else:
-                source_type = "general"
-                
-            if source_type == "Volexity":
-                prompt = f"""You are a cybersecurity threat intelligence analyst. You need to create a concise, technical summary of the following Volexity threat intelligence article. 
+# Prompt for summarizing a Volexity article
+_VOLEXITY_TMPL = """You are a cybersecurity threat intelligence analyst. You need to create a concise, technical summary of the following Volexity threat intelligence article. 
 
 Title: {title}
 
@@ -76,8 +49,9 @@ Volexity is known for detailed threat actor attribution and technical analysis o
 
 Your summary should be technical but clear, aimed at cybersecurity professionals. Keep the summary concise (250-350 words) and emphasize attribution details and actionable intelligence.
 """
-            else:
-                prompt = f"""You are a cybersecurity threat intelligence analyst. You need to create a concise, technical summary of the following threat intelligence article. 
+
+# Prompt for summarizing any other article
+_GENERAL_TMPL = """You are a cybersecurity threat intelligence analyst. You need to create a concise, technical summary of the following threat intelligence article. 
 
 Title: {title}
 
@@ -97,50 +71,984 @@ Please provide a summary that:
 Your summary should be technical but clear, aimed at cybersecurity professionals. Keep the summary concise (250-350 words) and focus on actionable intelligence.
 """
 
-            # Call the Claude API
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=2000,
-                temperature=0.0,  # Use a low temperature for more deterministic output
-                system="You are a cybersecurity threat intelligence analyst assistant. Provide accurate, concise, technical summaries of threat intelligence.",
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
+# Article prompt template by source type
+_PROMPT_TEMPLATES = {
+    "Volexity": _VOLEXITY_TMPL,
+    "general": _GENERAL_TMPL
+}
+
+# Source types detected from the article title by a lowercase keyword,
+# checked in order; add an entry (and a template above) for a new source
+_SOURCE_TYPES = (
+    ("volexity", "Volexity"),
+)
+
+_ARTICLE_SYSTEM_MSG = "You are a cybersecurity threat intelligence analyst assistant. Provide accurate, concise, technical summaries of threat intelligence."
+
+# Article summaries outside this word count are regenerated with the escalation model
+_MIN_SUMMARY_WORDS = 250
+_MAX_SUMMARY_WORDS = 400
+
+# Attempts and maximum backoff (seconds) for rate-limited, overloaded or timed
+# out requests
+_MAX_ATTEMPTS = 6
+_MAX_BACKOFF = 30
+
+def _is_retryable(error):
+    """
+    Check whether a failed Claude API request is worth retrying after a backoff.
+    
+    Args:
+        error (Exception): Error the request failed with, an anthropic.APIError
+            or an httpx.TimeoutException raised while a response streams in
+    
+    Returns:
+        bool: True for rate limits (429), server errors such as overloaded
+            (529), timeouts and connection errors
+    """
+    if isinstance(error, anthropic.APIStatusError):
+        return error.status_code == 429 or error.status_code >= 500
+    return isinstance(error, (anthropic.APIConnectionError, httpx.TimeoutException))
+
+def _backoff_delay(attempt):
+    """
+    Get the delay before retrying a request, exponential with jitter.
+    
+    Args:
+        attempt (int): Number of the failed attempt, from 0
+    
+    Returns:
+        float: Seconds to wait
+    """
+    return min(_MAX_BACKOFF, 2 ** attempt) * random.uniform(0.5, 1.0)
+
+class _RateLimiter:
+    """Spaces out the start of Claude API requests to stay under a requests-per-minute limit"""
+    
+    def __init__(self, requests_per_minute):
+        """
+        Initialize the limiter.
+        
+        Args:
+            requests_per_minute (float): Maximum number of requests started per minute
+        """
+        self.interval = 60.0 / requests_per_minute
+        self._lock = threading.Lock()
+        self._next_request = 0.0
+    
+    def reserve(self):
+        """
+        Reserve the next request slot.
+        
+        Thread-safe and independent of any event loop, so it works for sync
+        and async callers alike; the caller sleeps for the returned delay.
+        
+        Returns:
+            float: Seconds until the reserved slot starts
+        """
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_request)
+            self._next_request = start + self.interval
+        
+        return start - now
+
+# Cleanup of the executive summary response before JSON parsing
+_NEWLINES_RE = re.compile(r'\r\n?')
+_CTRL_CHARS_RE = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]')
+
+# Decoder for JSON objects embedded in response text; raw newlines and tabs
+# inside strings are tolerated
+_JSON_DECODER = json.JSONDecoder(strict=False)
+
+def extract_json(text):
+    """
+    Find the first JSON object embedded in text, e.g. within prose or a markdown fence.
+    
+    Args:
+        text (str): Text to search
+    
+    Returns:
+        dict: First object that parses, or None if there is none
+    """
+    start = text.find('{')
+    while start >= 0:
+        try:
+            obj, _ = _JSON_DECODER.raw_decode(text, start)
+            if isinstance(obj, dict):
+                return obj
+        except json.JSONDecodeError:
+            pass
+        start = text.find('{', start + 1)
+    
+    return None
+
+# Prompt for the executive summary, filled with str.format
+_EXEC_SUMMARY_TMPL = """You are a senior cybersecurity threat intelligence analyst preparing an executive summary for C-level executives and board members. You have the following summaries of recent threat intelligence articles, as parallel lists with one entry per article:
+
+{article_data}
+
+Please create an executive summary that:
+
+1. Identifies the 3-5 most significant cybersecurity threats from these articles
+2. Focuses on business impact rather than technical details
+3. Highlights industry trends and emerging threats
+4. Identifies the most critical threat actors and their targets
+5. Provides clear, actionable recommendations for organizational security
+
+Record the executive summary with the emit_executive_summary tool.
+
+Keep the executive summary non-technical and easily understandable by executives without cybersecurity background.
+"""
+
+_EXEC_SYSTEM_MSG = """You are a senior cybersecurity threat intelligence analyst assistant. Distill complex technical information into clear, business-focused executive summaries. 
+
+Always record your output with the tool provided. Be concise and direct in your summaries.
+
+For the executive_summary field:
+1. Include ONLY the actual summary text
+2. Do NOT include phrases like "Here is the executive summary" or "Based on the analyzed intelligence" 
+3. Do NOT include references to the tool input structure or other sections
+4. Do NOT include the words "executive_summary", "key_actors", "critical_iocs", or "recommendations" in your summary text
+5. Write in a clear, professional style appropriate for business executives
+
+For the key_actors, critical_iocs, and recommendations fields:
+1. Follow the exact format requested
+2. Be specific and detailed for each entry
+3. Ensure information is accurate and actionable"""
+
+# Tool the executive summary is requested through, so the model returns
+# structured input instead of JSON embedded in free text
+_EXEC_SUMMARY_TOOL = {
+    "name": "emit_executive_summary",
+    "description": "Record the executive summary of the analyzed threat intelligence articles.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "executive_summary": {
+                "type": "string",
+                "description": "The main executive summary text (400-600 words), without references to the other sections"
+            },
+            "key_actors": {
+                "type": "array",
+                "description": "The most critical threat actors, e.g. APT29: Russian state-sponsored group targeting government and defense sectors",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "name": {"type": "string"},
+                        "description": {"type": "string"}
+                    },
+                    "required": ["name", "description"]
+                }
+            },
+            "critical_iocs": {
+                "type": "array",
+                "description": "The most important IOCs, e.g. domain malicious-domain.com: C2 server for Emotet campaign",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "type": {"type": "string"},
+                        "value": {"type": "string"},
+                        "description": {"type": "string"}
+                    },
+                    "required": ["type", "value", "description"]
+                }
+            },
+            "recommendations": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Strategic recommendations (3-5 bullet points)"
+            }
+        },
+        "required": ["executive_summary", "key_actors", "critical_iocs", "recommendations"]
+    }
+}
+
+# Near-duplicate detection for the executive summary input: summaries whose
+# word shingles overlap at least this much (Jaccard) cover the same story
+_SHINGLE_SIZE = 3
+_DUPLICATE_THRESHOLD = 0.8
+
+# Characters of each article summary included in the executive summary prompt
+# (its most informative paragraphs if it's longer)
+_EXEC_SUMMARY_CHARS = 500
+
+def _shingles(text):
+    """
+    Split text into the set of its overlapping word n-grams.
+    
+    Args:
+        text (str): Text to split
+    
+    Returns:
+        frozenset: Word shingles (the lone word tuple for very short texts)
+    """
+    words = text.lower().split()
+    if len(words) <= _SHINGLE_SIZE:
+        return frozenset([tuple(words)])
+    return frozenset(zip(*(words[i:] for i in range(_SHINGLE_SIZE))))
+
+def _published_sort_key(article):
+    """
+    Get a sort key ordering articles by publication date.
+    
+    Dates are stored as scraped: RFC 822 for RSS feeds, ISO 8601 for Atom
+    and JSON feeds. Dates without a timezone are taken as UTC.
+    
+    Args:
+        article (dict): Article dictionary
+    
+    Returns:
+        tuple: Key sorting earlier dates first and missing or unparseable ones last
+    """
+    date = article.get('published_date')
+    if date:
+        try:
+            published = parsedate_to_datetime(date)
+        except (TypeError, ValueError):
+            try:
+                published = datetime.fromisoformat(date)
+            except ValueError:
+                published = None
+        
+        if published is not None:
+            if published.tzinfo is None:
+                published = published.replace(tzinfo=timezone.utc)
+            return (False, published)
+    
+    return (True, None)
+
+def _drop_near_duplicates(articles, limit=None):
+    """
+    Collapse articles whose summaries are near duplicates, e.g. the same
+    breach covered by several sources.
+    
+    Args:
+        articles (list): List of article dictionaries with summaries
+        limit (int, optional): Stop once this many distinct articles are kept,
+            as the comparison is pairwise
+    
+    Returns:
+        list: One article per cluster (the earliest published), in the
+            original order
+    """
+    kept = []
+    for article in articles:
+        if limit is not None and len(kept) >= limit:
+            break
+        
+        shingles = _shingles(article['summary'])
+        for i, (other, other_shingles) in enumerate(kept):
+            if len(shingles & other_shingles) >= _DUPLICATE_THRESHOLD * len(shingles | other_shingles):
+                if _published_sort_key(article) < _published_sort_key(other):
+                    kept[i] = (article, other_shingles)
+                break
+        else:
+            kept.append((article, shingles))
+    
+    return [article for article, _ in kept]
+
+def _select_iocs(articles, per_type=5, fallback_count=3):
+    """
+    Pick the IOCs shown to the model and the fallback critical IOCs in one pass.
+    
+    Args:
+        articles (list): List of article dictionaries with optional iocs
+        per_type (int): IOCs of each type included per article
+        fallback_count (int): Number of fallback critical IOCs
+    
+    Returns:
+        tuple: (top IOCs by type for each article, fallback critical IOC dicts
+            made of the first IOC of each type, across articles)
+    """
+    top_iocs = []
+    fallback_iocs = []
+    for article in articles:
+        article_top = {}
+        for ioc_type, iocs in (article.get('iocs') or {}).items():
+            if not iocs:
+                continue
+            article_top[ioc_type] = iocs[:per_type]
+            if len(fallback_iocs) < fallback_count:
+                fallback_iocs.append({
+                    "type": ioc_type,
+                    "value": iocs[0]['value'],
+                    "description": f"Found in {article['title']}"
+                })
+        top_iocs.append(article_top)
+    
+    return top_iocs, fallback_iocs
+
+# Connection settings shared by the Claude API clients; HTTP/2 is used when
+# the h2 package is installed. The overall timeout matches the SDK's default,
+# as a non-streamed executive summary can take minutes to generate
+_HTTP2 = importlib.util.find_spec('h2') is not None
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+_HTTP_TIMEOUT = httpx.Timeout(600.0, connect=10.0)
+
+# Streamed responses fail fast if no chunk arrives for 30 seconds
+_STREAM_TIMEOUT = httpx.Timeout(600.0, connect=10.0, read=30.0)
+
+@functools.lru_cache(maxsize=None)
+def _http_client():
+    """
+    Get the connection pool shared by all synchronous Claude API clients.
+    
+    Returns:
+        httpx.Client: Pooled HTTP client
+    """
+    return httpx.Client(http2=_HTTP2, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+
+# Async Claude API clients by event loop, then API key; pooled connections
+# are bound to the loop that opened them, and asyncio.run starts a new one
+_async_clients = weakref.WeakKeyDictionary()
+
+@functools.lru_cache(maxsize=4)
+def get_client(api_key):
+    """
+    Get the Claude API client for an API key, shared by all summarizers.
+    
+    Args:
+        api_key (str): Claude AI API key
+    
+    Returns:
+        anthropic.Anthropic: Client on the shared connection pool
+    """
+    return anthropic.Anthropic(api_key=api_key, http_client=_http_client())
+
+def get_async_client(api_key):
+    """
+    Get the async Claude API client for an API key on the running event loop,
+    shared by all summarizers. Must be called from a coroutine.
+    
+    Args:
+        api_key (str): Claude AI API key
+    
+    Returns:
+        anthropic.AsyncAnthropic: Client on the event loop's connection pool
+    """
+    clients = _async_clients.setdefault(asyncio.get_running_loop(), {})
+    if api_key not in clients:
+        http_client = httpx.AsyncClient(http2=_HTTP2, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+        clients[api_key] = anthropic.AsyncAnthropic(api_key=api_key, http_client=http_client)
+    return clients[api_key]
+
+def _build_prompt(title, content, iocs=None, source_type=None):
+    """
+    Build the summarization prompt for an article.
+    
+    Args:
+        title (str): Article title
+        content (str): Article content
+        iocs (dict, optional): Extracted IOCs
+        source_type (str, optional): "Volexity" or "general", detected from
+            the title if not given
+    
+    Returns:
+        str: Prompt text
+    """
+    # Prepare IOCs section if available
+    iocs_text = ""
+    if iocs:
+        parts = ["Extracted Indicators of Compromise (IOCs):\n"]
+        for ioc_type, ioc_list in iocs.items():
+            parts.append(f"\n{ioc_type.upper()}:\n")
+            # One formatted line per IOC rather than up to three fragments
+            parts.extend(
+                f"- {ioc['value']} (Context: {ioc['context']})\n" if ioc.get('context')
+                else f"- {ioc['value']}\n"
+                for ioc in ioc_list
             )
+        iocs_text = "".join(parts)
+    
+    # Check for source-specific customization
+    if source_type is None:
+        title_lower = title.lower()
+        source_type = next(
+            (name for keyword, name in _SOURCE_TYPES if keyword in title_lower),
+            "general"
+        )
+    
+    return _PROMPT_TEMPLATES[source_type].format(title=title, content=content, iocs_text=iocs_text)
+
+def _article_message_params(model, max_output_tokens, max_input_chars, title, content, iocs=None):
+    """
+    Build the Messages API parameters for summarizing an article.
+    
+    A module-level function of plain arguments, so it can be run in a worker
+    process for large articles.
+    
+    Args:
+        model (str): Claude model to use
+        max_output_tokens (int): Token cap for the summary
+        max_input_chars (int): Longer content is cut down to its most
+            informative paragraphs
+        title (str): Article title
+        content (str): Article content
+        iocs (dict, optional): Extracted IOCs
+    
+    Returns:
+        dict: Keyword arguments for messages.create
+    """
+    return {
+        'model': model,
+        'max_tokens': max_output_tokens,
+        'temperature': 0.0,  # Use a low temperature for more deterministic output
+        'system': _ARTICLE_SYSTEM_MSG,
+        'messages': [
+            {"role": "user", "content": _build_prompt(
+                title, compress(title, content, iocs, max_input_chars), iocs
+            )}
+        ]
+    }
+
+class ArticleSummarizer:
+    """Generates summaries for individual threat intelligence articles"""
+    
+    def __init__(self, api_key, model="claude-3-5-haiku-latest", use_batch_api=False,
+                 cache_path=None, cache_ttl=None, max_output_tokens=700, min_content_chars=200,
+                 cache=None, max_input_chars=12000, escalation_model="claude-3-5-sonnet-latest",
+                 requests_per_minute=None):
+        """
+        Initialize the article summarizer.
+        
+        Args:
+            api_key (str): Claude AI API key
+            model (str): Claude model to use
+            use_batch_api (bool): Submit summarize_batch jobs through the Message
+                Batches API (half the cost, results within 24 hours)
+            cache_path (str, optional): SQLite file caching responses to identical
+                requests; responses aren't cached if not given
+            cache_ttl (float, optional): Seconds a cached response stays valid
+            max_output_tokens (int): Token cap for each summary, about twice the
+                length of the requested 250-350 words
+            min_content_chars (int): Articles with less content than this are
+                "summarized" as their content (or title) without calling the API
+            cache (LLMCache, optional): Response cache to use instead of opening
+                one at cache_path, e.g. to share it between summarizers
+            max_input_chars (int): Longer article content is cut down to its most
+                informative paragraphs before it's sent
+            escalation_model (str, optional): Model that regenerates summaries
+                whose length is off target; no regeneration if None
+            requests_per_minute (float, optional): Request rate to stay under,
+                e.g. the account tier's limit; unlimited if None
+        """
+        self.api_key = api_key
+        self.model = model
+        self.use_batch_api = use_batch_api
+        self.max_input_chars = max_input_chars
+        self.escalation_model = escalation_model
+        self.max_output_tokens = max_output_tokens
+        self.min_content_chars = min_content_chars
+        self.cache = cache or (LLMCache(cache_path, cache_ttl) if cache_path else None)
+        self._limiter = _RateLimiter(requests_per_minute) if requests_per_minute else None
+        self.client = get_client(api_key)
+    
+    @property
+    def aclient(self):
+        """anthropic.AsyncAnthropic: Async client for the running event loop"""
+        return get_async_client(self.api_key)
+    
+    def _stub_summary(self, title, content):
+        """
+        Get the summary of a stub article, which isn't worth an API call.
+        
+        Args:
+            title (str): Article title
+            content (str): Article content
+        
+        Returns:
+            str: The article's content (or title if it has none), or None if
+                the content is long enough to summarize
+        """
+        content = (content or '').strip()
+        if len(content) >= self.min_content_chars:
+            return None
+        
+        logger.info(f"Skipping summarization of short article: {title}")
+        return content or title.strip()
+    
+    def _message_params(self, title, content, iocs=None):
+        """
+        Build the Messages API parameters for summarizing an article.
+        
+        Args:
+            title (str): Article title
+            content (str): Article content
+            iocs (dict, optional): Extracted IOCs
+        
+        Returns:
+            dict: Keyword arguments for messages.create
+        """
+        return _article_message_params(
+            self.model, self.max_output_tokens, self.max_input_chars, title, content, iocs
+        )
+    
+    def _should_escalate(self, params, summary):
+        """
+        Check whether a summary should be regenerated with the escalation model.
+        
+        Args:
+            params (dict): Keyword arguments the summary was generated with
+            summary (str): Generated summary
+        
+        Returns:
+            bool: True if the summary's length is off target and a different
+                model is available to retry with
+        """
+        if not self.escalation_model or params['model'] == self.escalation_model:
+            return False
+        
+        return not _MIN_SUMMARY_WORDS <= len(summary.split()) <= _MAX_SUMMARY_WORDS
+    
+    def _stream_text(self, params, on_token=None):
+        """
+        Call the Claude API, streaming the response so a stalled connection is
+        dropped after a short idle period rather than blocking the caller, and
+        so the caller can consume the text as it's generated.
+        
+        Requests are backed off exponentially (with jitter) while rate limited,
+        overloaded or timing out, unless part of the response was already
+        passed to on_token. The SDK's own retries are disabled so each attempt
+        is a single request through the rate limiter.
+        
+        Args:
+            params (dict): Keyword arguments for messages.stream
+            on_token (callable, optional): Called with each chunk of text
+        
+        Returns:
+            str: Response text
+        
+        Raises:
+            anthropic.APIError: If the request fails after all retries
+            httpx.TimeoutException: If the stream stalls on every attempt
+        """
+        client = self.client.with_options(max_retries=0)
+        for attempt in range(_MAX_ATTEMPTS):
+            streamed = False
+            if self._limiter:
+                time.sleep(self._limiter.reserve())
+            try:
+                with client.messages.stream(**params, timeout=_STREAM_TIMEOUT) as stream:
+                    for text in stream.text_stream:
+                        streamed = True
+                        if on_token:
+                            on_token(text)
+                    if stream.get_final_message().stop_reason == 'max_tokens':
+                        logger.warning(f"Summary cut off at {params['max_tokens']} tokens")
+                    return stream.get_final_text().strip()
+            except (anthropic.APIError, httpx.TimeoutException) as e:
+                if (streamed and on_token) or attempt == _MAX_ATTEMPTS - 1 or not _is_retryable(e):
+                    raise
+                delay = _backoff_delay(attempt)
+                logger.warning(f"Retrying summary in {delay:.1f}s: {str(e)}")
+                time.sleep(delay)
+    
+    async def _create_async(self, params, title):
+        """
+        Call the Claude API asynchronously, backing off exponentially (with
+        jitter) while rate limited, overloaded or timing out.
+        
+        The response is streamed so a stalled connection is dropped after a
+        short idle period, and retried, rather than holding up its slot for
+        the full request timeout. The SDK's own retries are disabled so each
+        attempt is a single request through the rate limiter.
+        
+        Args:
+            params (dict): Keyword arguments for messages.stream
+            title (str): Article title, for logging
+        
+        Returns:
+            str: Response text
+        
+        Raises:
+            anthropic.APIError: If the request fails after all retries
+            httpx.TimeoutException: If the stream stalls on every attempt
+        """
+        client = self.aclient.with_options(max_retries=0)
+        for attempt in range(_MAX_ATTEMPTS):
+            if self._limiter:
+                await asyncio.sleep(self._limiter.reserve())
+            try:
+                async with client.messages.stream(**params, timeout=_STREAM_TIMEOUT) as stream:
+                    response = await stream.get_final_message()
+                break
+            except (anthropic.APIError, httpx.TimeoutException) as e:
+                if attempt == _MAX_ATTEMPTS - 1 or not _is_retryable(e):
+                    raise
+                delay = _backoff_delay(attempt)
+                logger.warning(f"Retrying summary for {title} in {delay:.1f}s: {str(e)}")
+                await asyncio.sleep(delay)
+        
+        if response.stop_reason == 'max_tokens':
+            logger.warning(f"Summary for {title} cut off at {params['max_tokens']} tokens")
+        return response.content[0].text.strip()
+    
+    def summarize(self, title, content, iocs=None, bypass_cache=False, on_token=None):
+        """
+        Generate a summary for an article using Claude AI.
+        
+        Args:
+            title (str): Article title
+            content (str): Article content
+            iocs (dict, optional): Extracted IOCs
+            bypass_cache (bool): Request a fresh summary even if one is cached
+            on_token (callable, optional): Called with each chunk of text as the
+                response streams in; a cached summary is passed in one call.
+                Streamed summaries aren't escalated, as the text has already
+                been passed on
+        
+        Returns:
+            str or None: Generated summary, None if it couldn't be generated
+        """
+        try:
+            summary = self._stub_summary(title, content)
+            if summary is not None:
+                if on_token:
+                    on_token(summary)
+                return summary
             
-            # Extract the summary
-            summary = response.content[0].text.strip()
+            params = self._message_params(title, content, iocs)
+            key = cache_key(params)
+            
+            if self.cache and not bypass_cache:
+                summary = self.cache.get(key)
+                if summary is not None:
+                    logger.info(f"Using cached summary for article: {title}")
+                    if on_token:
+                        on_token(summary)
+                    return summary
+            
+            # Call the Claude API
+            summary = self._stream_text(params, on_token)
+            if not on_token and self._should_escalate(params, summary):
+                logger.info(f"Regenerating off-target summary with {self.escalation_model}: {title}")
+                summary = self._stream_text(dict(params, model=self.escalation_model), on_token)
             logger.info(f"Generated summary for article: {title}")
             
+            if self.cache:
+                self.cache.set(key, summary)
+            
             return summary
             
         except Exception as e:
             logger.error(f"Error generating summary: {str(e)}")
-            return f"Error generating summary: {str(e)}"
+            return None
+    
+    async def _generate_async(self, title, content, iocs=None, bypass_cache=False, pool=None):
+        """
+        Generate a summary asynchronously, backing off on rate limits, overload and timeouts.
+        
+        Args:
+            title (str): Article title
+            content (str): Article content
+            iocs (dict, optional): Extracted IOCs
+            bypass_cache (bool): Request a fresh summary even if one is cached
+            pool (concurrent.futures.Executor, optional): Worker processes the
+                prompt of a long article is built in, keeping the event loop free
+        
+        Returns:
+            str: Generated summary
+        
+        Raises:
+            anthropic.APIError: If the request fails after all retries
+            httpx.TimeoutException: If the response stalls on every attempt
+        """
+        summary = self._stub_summary(title, content)
+        if summary is not None:
+            return summary
+        
+        if pool is not None and len(content) > self.max_input_chars:
+            # Only content beyond max_input_chars needs the paragraph scoring
+            # that's worth shipping to another process
+            params = await asyncio.get_running_loop().run_in_executor(pool, functools.partial(
+                _article_message_params, self.model, self.max_output_tokens, self.max_input_chars,
+                title, content, iocs
+            ))
+        else:
+            params = self._message_params(title, content, iocs)
+        key = cache_key(params)
+        
+        if self.cache and not bypass_cache:
+            summary = self.cache.get(key)
+            if summary is not None:
+                logger.info(f"Using cached summary for article: {title}")
+                return summary
+        
+        # Call the Claude API
+        summary = await self._create_async(params, title)
+        if self._should_escalate(params, summary):
+            logger.info(f"Regenerating off-target summary with {self.escalation_model}: {title}")
+            summary = await self._create_async(dict(params, model=self.escalation_model), title)
+        logger.info(f"Generated summary for article: {title}")
+        
+        if self.cache:
+            self.cache.set(key, summary)
+        
+        return summary
+    
+    async def summarize_async(self, title, content, iocs=None, bypass_cache=False):
+        """
+        Generate a summary for an article using Claude AI without blocking the event loop.
+        
+        Args:
+            title (str): Article title
+            content (str): Article content
+            iocs (dict, optional): Extracted IOCs
+            bypass_cache (bool): Request a fresh summary even if one is cached
+        
+        Returns:
+            str or None: Generated summary, None if it couldn't be generated
+        """
+        try:
+            return await self._generate_async(title, content, iocs, bypass_cache)
+        except Exception as e:
+            logger.error(f"Error generating summary: {str(e)}")
+            return None
+    
+    async def stream_summary(self, title, content, iocs=None, bypass_cache=False):
+        """
+        Generate a summary for an article, yielding the text as it's generated.
+        
+        Args:
+            title (str): Article title
+            content (str): Article content
+            iocs (dict, optional): Extracted IOCs
+            bypass_cache (bool): Request a fresh summary even if one is cached
+        
+        Yields:
+            str: Chunks of the summary; a cached or stub summary is yielded whole
+        """
+        summary = self._stub_summary(title, content)
+        if summary is not None:
+            yield summary
+            return
+        
+        params = self._message_params(title, content, iocs)
+        key = cache_key(params)
+        
+        if self.cache and not bypass_cache:
+            summary = self.cache.get(key)
+            if summary is not None:
+                logger.info(f"Using cached summary for article: {title}")
+                yield summary
+                return
+        
+        # Call the Claude API
+        if self._limiter:
+            await asyncio.sleep(self._limiter.reserve())
+        async with self.aclient.messages.stream(**params, timeout=_STREAM_TIMEOUT) as stream:
+            async for text in stream.text_stream:
+                yield text
+            summary = (await stream.get_final_text()).strip()
+        logger.info(f"Generated summary for article: {title}")
+        
+        if self.cache:
+            self.cache.set(key, summary)
+    
+    async def summarize_articles(self, articles, concurrency=8, on_result=None, pool=None):
+        """
+        Generate summaries for stored articles concurrently.
+        
+        Failures are reported per article, so one failing request never
+        aborts the rest.
+        
+        Args:
+            articles (list): List of article dictionaries with id, title,
+                content and optional iocs keys
+            concurrency (int): Maximum number of requests in flight
+            on_result (callable, optional): Called with each result as soon as
+                its article is done, e.g. to store it while others are pending
+            pool (concurrent.futures.Executor, optional): Worker processes the
+                prompts of long articles are built in
+        
+        Returns:
+            list: Dictionaries with the article id and either a summary or
+                an error key, in the order of articles
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def summarize(article):
+            async with semaphore:
+                try:
+                    summary = await self._generate_async(
+                        article['title'], article['content'], article.get('iocs'), pool=pool
+                    )
+                    result = {'id': article['id'], 'summary': summary}
+                except Exception as e:
+                    logger.error(f"Error generating summary for article ID {article['id']}: {str(e)}")
+                    result = {'id': article['id'], 'error': str(e)}
+            
+            if on_result:
+                on_result(result)
+            return result
+        
+        return await asyncio.gather(*(summarize(article) for article in articles))
+    
+    async def summarize_many(self, items, concurrency=10):
+        """
+        Generate summaries for several articles concurrently.
+        
+        Args:
+            items (list): List of dictionaries with title, content and optional iocs keys
+            concurrency (int): Maximum number of requests in flight
+        
+        Returns:
+            list: Generated summaries (None where one couldn't be generated),
+                in the order of items
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def summarize(item):
+            async with semaphore:
+                return await self.summarize_async(**item)
+        
+        results = await asyncio.gather(*(summarize(item) for item in items), return_exceptions=True)
+        
+        return [None if isinstance(result, BaseException) else result for result in results]
+    
+    def summarize_batch(self, items, concurrency=10):
+        """
+        Generate summaries for several articles from synchronous code.
+        
+        Uses the Message Batches API if use_batch_api is set, concurrent
+        requests otherwise.
+        
+        Args:
+            items (list): List of dictionaries with title, content and optional iocs keys
+            concurrency (int): Maximum number of requests in flight
+        
+        Returns:
+            list: Generated summaries (None where one couldn't be generated),
+                in the order of items
+        """
+        if self.use_batch_api:
+            return self.summarize_via_batch(items)
+        return asyncio.run(self.summarize_many(items, concurrency))
+    
+    def summarize_via_batch(self, items, poll_interval=20):
+        """
+        Generate summaries for several articles with the Message Batches API.
+        
+        Blocks until the batch has ended, polling its status every
+        poll_interval seconds.
+        
+        Args:
+            items (list): List of dictionaries with title, content and optional iocs keys
+            poll_interval (float): Seconds between status checks
+        
+        Returns:
+            list: Generated summaries (None where one couldn't be generated),
+                in the order of items
+        """
+        results = self.summarize_articles_via_batch(
+            [dict(item, id=index) for index, item in enumerate(items)], poll_interval
+        )
+        return [result.get('summary') for result in results]
+    
+    def summarize_articles_via_batch(self, articles, poll_interval=20):
+        """
+        Generate summaries for stored articles with the Message Batches API.
+        
+        Blocks until the batch has ended, polling its status every
+        poll_interval seconds.
+        
+        Args:
+            articles (list): List of article dictionaries with id, title,
+                content and optional iocs keys
+            poll_interval (float): Seconds between status checks
+        
+        Returns:
+            list: Dictionaries with the article id and either a summary or
+                an error key, in the order of articles
+        """
+        if not articles:
+            return []
+        
+        try:
+            params = [
+                self._message_params(article['title'], article['content'], article.get('iocs'))
+                for article in articles
+            ]
+            keys = [cache_key(item_params) for item_params in params]
+            results = [{'id': article['id'], 'error': "no result in batch"} for article in articles]
+            
+            # Only submit articles worth summarizing without a cached summary
+            requests = []
+            for index, item_params in enumerate(params):
+                summary = self._stub_summary(articles[index]['title'], articles[index]['content'])
+                if summary is None and self.cache:
+                    summary = self.cache.get(keys[index])
+                if summary is not None:
+                    results[index] = {'id': articles[index]['id'], 'summary': summary}
+                else:
+                    requests.append({'custom_id': f"article-{index}", 'params': item_params})
+            
+            if not requests:
+                return results
+            
+            batch = self.client.messages.batches.create(requests=requests)
+            logger.info(f"Submitted summarization batch {batch.id} with {len(requests)} articles")
+            
+            while batch.processing_status != "ended":
+                time.sleep(poll_interval)
+                batch = self.client.messages.batches.retrieve(batch.id)
+            
+            for entry in self.client.messages.batches.results(batch.id):
+                index = int(entry.custom_id.rpartition('-')[2])
+                article = articles[index]
+                
+                if entry.result.type == "succeeded":
+                    summary = entry.result.message.content[0].text.strip()
+                    results[index] = {'id': article['id'], 'summary': summary}
+                    logger.info(f"Generated summary for article: {article['title']}")
+                    if self.cache:
+                        self.cache.set(keys[index], summary)
+                else:
+                    logger.error(f"Batch request for {article['title']} {entry.result.type}")
+                    results[index] = {'id': article['id'], 'error': f"batch request {entry.result.type}"}
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"Error generating summaries via batch: {str(e)}")
+            return [{'id': article['id'], 'error': str(e)} for article in articles]
 
 
 class ExecutiveSummarizer:
     """Generates executive summaries from multiple article summaries"""
     
-    def __init__(self, api_key, model="claude-3-opus-20240229"):
+    def __init__(self, api_key, model="claude-3-opus-20240229", cache_path=None, cache_ttl=None,
+                 max_output_tokens=3000, cache=None):
         """
         Initialize the executive summarizer.
         
         Args:
             api_key (str): Claude AI API key
             model (str): Claude model to use
+            cache_path (str, optional): SQLite file caching responses to identical
+                requests; responses aren't cached if not given
+            cache_ttl (float, optional): Seconds a cached response stays valid
+            max_output_tokens (int): Token cap for the response, room for the
+                400-600 word summary plus the actor, IOC and recommendation
+                lists of the tool input
+            cache (LLMCache, optional): Response cache to use instead of opening
+                one at cache_path, e.g. to share it between summarizers
         """
         self.api_key = api_key
         self.model = model
-        self.client = anthropic.Anthropic(api_key=api_key)
+        self.max_output_tokens = max_output_tokens
+        self.cache = cache or (LLMCache(cache_path, cache_ttl) if cache_path else None)
+        self.client = get_client(api_key)
     
-    def create_summary(self, articles, max_articles=20):
+    def create_summary(self, articles, max_articles=20, bypass_cache=False):
         """
         Create an executive summary from multiple articles.
         
         Args:
             articles (list): List of article dictionaries with summaries
             max_articles (int): Maximum number of articles to include
+            bypass_cache (bool): Request a fresh summary even if one is cached
         
         Returns:
             dict: Dictionary containing:
@@ -150,206 +1058,103 @@ class ExecutiveSummarizer:
                 - recommendations: List of recommendations
         """
         try:
-            # Limit the number of articles to avoid token limits
-            articles = articles[:max_articles]
+            # Collapse near-duplicate coverage, limiting the number of
+            # articles to avoid token limits
+            unique = _drop_near_duplicates(articles, max_articles)
+            logger.info(f"Selected {len(unique)} distinct articles of {len(articles)}")
+            articles = unique
+            
+            # IOCs for the prompt and, should the response name none, the summary
+            top_iocs, fallback_iocs = _select_iocs(articles)
+            
+            # Nothing to distill without an API call
+            if not articles:
+                logger.info("No articles to summarize, skipping executive summary")
+                return self.complete_summary({
+                    'executive_summary': "No threat intelligence articles were available for this period."
+                }, fallback_iocs)
+            
+            if len(articles) == 1:
+                logger.info("Single article to summarize, reusing its summary")
+                return self.complete_summary({'executive_summary': articles[0]['summary']}, fallback_iocs)
             
-            # Extract summaries and titles
-            article_data = []
+            # Extract summaries and titles, column by column so each key
+            # appears once in the prompt rather than once per article
+            article_data = {
+                'titles': [],
+                'summaries': [],
+                'sources': [],
+                'published_dates': []
+            }
             for article in articles:
-                article_data.append({
-                    'title': article['title'],
-                    'summary': article['summary'],
-                    'source': article['source'],
-                    'url': article['url'],
-                    'published_date': article.get('published_date', 'Unknown')
-                })
-                
-                # Also collect IOCs for better summary generation
-                if 'iocs' in article and article['iocs']:
-                    # Extract top IOCs for each type 
-                    top_iocs = {}
-                    for ioc_type, iocs in article['iocs'].items():
-                        if iocs:
-                            # Take up to 5 IOCs of each type
-                            top_iocs[ioc_type] = iocs[:5]
-                    
-                    if top_iocs:
-                        article_data[-1]['iocs'] = top_iocs
+                article_data['titles'].append(article['title'])
+                article_data['summaries'].append(
+                    compress(article['title'], article['summary'], article.get('iocs'), _EXEC_SUMMARY_CHARS)
+                )
+                article_data['sources'].append(article['source'])
+                article_data['published_dates'].append(article.get('published_date', 'Unknown'))
+            
+            # Also include the top IOCs for better summary generation
+            article_data['iocs'] = top_iocs
             
             # Construct the prompt
-            prompt = f"""You are a senior cybersecurity threat intelligence analyst preparing an executive summary for C-level executives and board members. You have the following summaries of recent threat intelligence articles:
-
-{json.dumps(article_data, indent=2)}
-
-Please create an executive summary that:
-
-1. Identifies the 3-5 most significant cybersecurity threats from these articles
-2. Focuses on business impact rather than technical details
-3. Highlights industry trends and emerging threats
-4. Identifies the most critical threat actors and their targets
-5. Provides clear, actionable recommendations for organizational security
-
-Format your response as a structured JSON object with the following keys:
-- executive_summary: The main executive summary text (400-600 words) - this should be ONLY the summary text, not references to other sections
-- key_actors: Array of objects with "name" and "description" fields for each key threat actor
-- critical_iocs: Array of objects with "type", "value", and "description" fields for the most important IOCs
-- recommendations: Array of strategic recommendation strings (3-5 bullet points)
-
-Example format:
-{{
-  "executive_summary": "Text of the executive summary...",
-  "key_actors": [
-    {{
-      "name": "APT29",
-      "description": "Russian state-sponsored group targeting government and defense sectors"
-    }},
-    {{
-      "name": "FIN7",
-      "description": "Financially motivated actor targeting retail and hospitality"
-    }}
-  ],
-  "critical_iocs": [
-    {{
-      "type": "domain",
-      "value": "malicious-domain.com",
-      "description": "C2 server for Emotet campaign"
-    }},
-    {{
-      "type": "ip",
-      "value": "192.168.1.1",
-      "description": "Scanning host for vulnerability XYZ"
-    }}
-  ],
-  "recommendations": [
-    "Implement MFA across all remote access services",
-    "Patch vulnerable systems against CVE-2023-12345 immediately",
-    "Update EDR signatures to detect the Lazarus campaign IOCs"
-  ]
-}}
-
-Keep the executive summary non-technical and easily understandable by executives without cybersecurity background.
-"""
-
-            # Call the Claude API
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=4000,
-                temperature=0.3,
-                system="""You are a senior cybersecurity threat intelligence analyst assistant. Distill complex technical information into clear, business-focused executive summaries. 
-
-Always provide structured output in valid JSON format when requested. Be concise and direct in your summaries.
-
-For the executive_summary field:
-1. Include ONLY the actual summary text
-2. Do NOT include phrases like "Here is the executive summary" or "Based on the analyzed intelligence" 
-3. Do NOT include references to the JSON structure or other sections
-4. Do NOT include the words "executive_summary", "key_actors", "critical_iocs", or "recommendations" in your summary text
-5. Write in a clear, professional style appropriate for business executives
+            # Compact JSON keeps the prompt (and its token count) small; the
+            # model doesn't need the indentation or the article URLs
+            if orjson is not None:
+                article_json = orjson.dumps(article_data).decode('utf-8')
+            else:
+                article_json = json.dumps(article_data, separators=(',', ':'), ensure_ascii=False)
+            prompt = _EXEC_SUMMARY_TMPL.format(article_data=article_json)
 
-For the key_actors, critical_iocs, and recommendations fields:
-1. Follow the exact format requested
-2. Be specific and detailed for each entry
-3. Ensure information is accurate and actionable""",
-                messages=[
+            params = {
+                'model': self.model,
+                'max_tokens': self.max_output_tokens,
+                'temperature': 0.3,
+                'system': _EXEC_SYSTEM_MSG,
+                'tools': [_EXEC_SUMMARY_TOOL],
+                'tool_choice': {"type": "tool", "name": _EXEC_SUMMARY_TOOL['name']},
+                'messages': [
                     {"role": "user", "content": prompt}
                 ]
-            )
-            
-            # Extract and parse the JSON response
-            response_text = response.content[0].text.strip()
+            }
             
-            # Find and extract the JSON part
-            json_start = response_text.find('{')
-            json_end = response_text.rfind('}') + 1
+            key = cache_key(params)
+            summary_data = None
+            response_text = None
+            if self.cache and not bypass_cache:
+                response_text = self.cache.get(key)
+                if response_text is not None:
+                    logger.info("Using cached executive summary response")
             
-            if json_start >= 0 and json_end > json_start:
-                json_text = response_text[json_start:json_end]
-                
-                # Clean up the JSON text to handle control characters
-                json_text = json_text.replace('\r\n', '\n')
-                json_text = json_text.replace('\r', '\n')
+            if response_text is None:
+                # Call the Claude API
+                response = self.client.messages.create(**params)
                 
-                # Remove problematic control characters
-                json_text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', json_text)
+                # The forced tool call carries the summary as structured input
+                tool_use = next((block for block in response.content if block.type == 'tool_use'), None)
+                if tool_use is not None:
+                    summary_data = tool_use.input
+                    response_text = json.dumps(summary_data, ensure_ascii=False)
+                else:
+                    # Safety net: the model answered with a text block instead
+                    logger.warning("No tool use in executive summary response, parsing text")
+                    response_text = ''.join(block.text for block in response.content if block.type == 'text').strip()
                 
-                try:
-                    summary_data = json.loads(json_text)
-                    logger.info("Generated executive summary successfully")
-                    
-                    # Ensure all expected fields are present
-                    if 'executive_summary' not in summary_data:
-                        summary_data['executive_summary'] = "Executive summary could not be generated."
-                        
-                    if 'key_actors' not in summary_data or not summary_data['key_actors']:
-                        summary_data['key_actors'] = [
-                            {
-                                "name": "Unknown Threat Actor",
-                                "description": "No specific threat actors were identified in the analyzed reports."
-                            }
-                        ]
-                        
-                    if 'critical_iocs' not in summary_data or not summary_data['critical_iocs']:
-                        # Extract some IOCs from the articles as a fallback
-                        critical_iocs = []
-                        for article in articles:
-                            if 'iocs' in article and article['iocs']:
-                                for ioc_type, iocs in article['iocs'].items():
-                                    if iocs and len(iocs) > 0:
-                                        critical_iocs.append({
-                                            "type": ioc_type,
-                                            "value": iocs[0]['value'],
-                                            "description": f"Found in {article['title']}"
-                                        })
-                                        if len(critical_iocs) >= 3:
-                                            break
-                                if len(critical_iocs) >= 3:
-                                    break
-                        
-                        if critical_iocs:
-                            summary_data['critical_iocs'] = critical_iocs
-                        else:
-                            summary_data['critical_iocs'] = [
-                                {
-                                    "type": "N/A",
-                                    "value": "N/A",
-                                    "description": "No critical IOCs were identified in the analyzed reports."
-                                }
-                            ]
-                    
-                    if 'recommendations' not in summary_data or not summary_data['recommendations']:
-                        summary_data['recommendations'] = [
-                            "Maintain regular security patches and updates for all systems",
-                            "Implement multi-factor authentication for critical services",
-                            "Conduct regular security awareness training for employees",
-                            "Review and update incident response plans",
-                            "Maintain offline backups of critical data"
-                        ]
-                    
-                    return summary_data
-                    
-                except json.JSONDecodeError as e:
-                    logger.error(f"Failed to parse JSON response: {e}")
-                    logger.debug(f"Problematic JSON text (first 500 chars): {json_text[:500]}")
-                    
-                    # Try alternative parsing approach
-                    try:
-                        # Sometimes Claude wraps JSON in markdown code blocks
-                        if '```json' in response_text and '```' in response_text:
-                            json_start = response_text.find('```json') + 7
-                            json_end = response_text.find('```', json_start)
-                            if json_end > json_start:
-                                json_text = response_text[json_start:json_end].strip()
-                                # Clean control characters again
-                                json_text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', json_text)
-                                summary_data = json.loads(json_text)
-                                logger.info("Successfully parsed JSON from markdown code block")
-                                return summary_data
-                    except json.JSONDecodeError:
-                        pass
-                        
-                    # Try extracting individual sections manually if JSON parsing completely fails
-                    logger.warning("Attempting manual section extraction from response")
-                    return self.extract_sections_manually(response_text, articles)
+                # A response cut off by max_tokens is used as far as it goes,
+                # but not cached, so the next run asks again
+                if response.stop_reason == 'max_tokens':
+                    logger.warning(f"Executive summary cut off at {self.max_output_tokens} tokens")
+                elif self.cache:
+                    self.cache.set(key, response_text)
+            
+            if summary_data is None:
+                summary_data = self.parse_response_text(response_text, fallback_iocs)
+            else:
+                summary_data = self.complete_summary(summary_data, fallback_iocs)
+            
+            if summary_data is not None:
+                logger.info("Generated executive summary successfully")
+                return summary_data
             
             # Fallback if JSON parsing fails
             logger.warning("Using fallback for executive summary")
@@ -400,148 +1205,80 @@ For the key_actors, critical_iocs, and recommendations fields:
                 ]
             }
     
-    def extract_sections_manually(self, response_text, articles):
+    def complete_summary(self, summary_data, fallback_iocs):
         """
-        Manually extract sections from the response when JSON parsing fails.
+        Fill in any section missing from a parsed executive summary.
         
         Args:
-            response_text (str): The raw response text from Claude
-            articles (list): List of articles for fallback IOC extraction
-            
+            summary_data (dict): Parsed executive summary
+            fallback_iocs (list): Critical IOCs to use if the summary names none
+        
         Returns:
-            dict: Dictionary with extracted sections
+            dict: Executive summary with all expected fields present
         """
-        import re
-        
-        logger.info("Attempting manual extraction of executive summary sections")
-        
-        # Initialize result structure
-        result = {
-            'executive_summary': "",
-            'key_actors': [],
-            'critical_iocs': [],
-            'recommendations': []
-        }
-        
-        try:
-            # Try to extract executive summary (look for text before any structured sections)
-            exec_match = re.search(r'executive[_\s]*summary["\s]*:?\s*["\s]*([^"}\]]+)', response_text, re.IGNORECASE | re.DOTALL)
-            if exec_match:
-                exec_text = exec_match.group(1).strip()
-                # Clean up common artifacts
-                exec_text = re.sub(r'[,\]\}]+, ', exec_text)  # Remove trailing punctuation
-                exec_text = exec_text.replace('\n', ' ').strip()
-                if len(exec_text) > 50:  # Only use if it's substantial
-                    result['executive_summary'] = exec_text
-            
-            # Extract key actors
-            actors_section = re.search(r'key[_\s]*actors["\s]*:?\s*\[(.*?)\]', response_text, re.IGNORECASE | re.DOTALL)
-            if actors_section:
-                actors_text = actors_section.group(1)
-                # Look for name/description pairs
-                actor_matches = re.findall(r'["\s]*name["\s]*:?\s*["\s]*([^"}\],]+)["\s]*.*?["\s]*description["\s]*:?\s*["\s]*([^"}\]]+)', actors_text, re.IGNORECASE | re.DOTALL)
-                for name, desc in actor_matches:
-                    result['key_actors'].append({
-                        'name': name.strip(),
-                        'description': desc.strip()
-                    })
-            
-            # Extract IOCs
-            iocs_section = re.search(r'critical[_\s]*iocs["\s]*:?\s*\[(.*?)\]', response_text, re.IGNORECASE | re.DOTALL)
-            if iocs_section:
-                iocs_text = iocs_section.group(1)
-                # Look for type/value/description triplets
-                ioc_matches = re.findall(r'["\s]*type["\s]*:?\s*["\s]*([^"}\],]+)["\s]*.*?["\s]*value["\s]*:?\s*["\s]*([^"}\],]+)["\s]*.*?["\s]*description["\s]*:?\s*["\s]*([^"}\]]+)', iocs_text, re.IGNORECASE | re.DOTALL)
-                for ioc_type, value, desc in ioc_matches:
-                    result['critical_iocs'].append({
-                        'type': ioc_type.strip(),
-                        'value': value.strip(),
-                        'description': desc.strip()
-                    })
+        if 'executive_summary' not in summary_data:
+            summary_data['executive_summary'] = "Executive summary could not be generated."
             
-            # Extract recommendations
-            recs_section = re.search(r'recommendations["\s]*:?\s*\[(.*?)\]', response_text, re.IGNORECASE | re.DOTALL)
-            if recs_section:
-                recs_text = recs_section.group(1)
-                # Look for quoted strings
-                rec_matches = re.findall(r'["\s]*([^"}\],]+)["\s]*', recs_text)
-                for rec in rec_matches:
-                    clean_rec = rec.strip().rstrip(',')
-                    if len(clean_rec) > 10:  # Only include substantial recommendations
-                        result['recommendations'].append(clean_rec)
+        if 'key_actors' not in summary_data or not summary_data['key_actors']:
+            summary_data['key_actors'] = [
+                {
+                    "name": "Unknown Threat Actor",
+                    "description": "No specific threat actors were identified in the analyzed reports."
+                }
+            ]
             
-            # Apply fallbacks for empty sections
-            if not result['executive_summary']:
-                result['executive_summary'] = "Based on the analyzed threat intelligence, several key cybersecurity threats have emerged that require immediate attention. Organizations should implement robust security measures to mitigate these evolving threats."
-            
-            if not result['key_actors']:
-                result['key_actors'] = [
+        if 'critical_iocs' not in summary_data or not summary_data['critical_iocs']:
+            # Fall back to IOCs taken from the articles
+            if fallback_iocs:
+                summary_data['critical_iocs'] = list(fallback_iocs)
+            else:
+                summary_data['critical_iocs'] = [
                     {
-                        "name": "Various Threat Actors",
-                        "description": "Multiple threat actors were mentioned in the reports but specific details could not be extracted."
+                        "type": "N/A",
+                        "value": "N/A",
+                        "description": "No critical IOCs were identified in the analyzed reports."
                     }
                 ]
+        
+        if 'recommendations' not in summary_data or not summary_data['recommendations']:
+            summary_data['recommendations'] = [
+                "Maintain regular security patches and updates for all systems",
+                "Implement multi-factor authentication for critical services",
+                "Conduct regular security awareness training for employees",
+                "Review and update incident response plans",
+                "Maintain offline backups of critical data"
+            ]
+        
+        return summary_data
+    
+    def parse_response_text(self, response_text, fallback_iocs):
+        """
+        Parse an executive summary returned as text rather than through the tool.
+        
+        Args:
+            response_text (str): The raw response text from Claude
+            fallback_iocs (list): Critical IOCs to use if the response names none
+        
+        Returns:
+            dict: Parsed executive summary, or None if none could be recovered
+        """
+        # Normalize line endings and remove problematic control characters
+        text = _CTRL_CHARS_RE.sub('', _NEWLINES_RE.sub('\n', response_text))
+        
+        # An object without the summary is a nested one found after the
+        # outer object failed to parse
+        summary_data = extract_json(text)
+        if summary_data is None or 'executive_summary' not in summary_data:
+            json_start = text.find('{')
+            if json_start < 0:
+                return None
             
-            if not result['critical_iocs']:
-                # Try to extract some IOCs from the articles as fallback
-                critical_iocs = []
-                for article in articles:
-                    if 'iocs' in article and article['iocs']:
-                        for ioc_type, iocs in article['iocs'].items():
-                            if iocs and len(iocs) > 0:
-                                critical_iocs.append({
-                                    "type": ioc_type,
-                                    "value": iocs[0]['value'],
-                                    "description": f"Found in {article['title']}"
-                                })
-                                if len(critical_iocs) >= 3:
-                                    break
-                        if len(critical_iocs) >= 3:
-                            break
-                
-                if critical_iocs:
-                    result['critical_iocs'] = critical_iocs
-                else:
-                    result['critical_iocs'] = [
-                        {
-                            "type": "various",
-                            "value": "See individual reports",
-                            "description": "Various IOCs were identified in the individual reports."
-                        }
-                    ]
-            
-            if not result['recommendations']:
-                result['recommendations'] = [
-                    "Maintain regular security patches and updates for all systems",
-                    "Implement multi-factor authentication for critical services",
-                    "Conduct regular security awareness training for employees",
-                    "Review and update incident response plans",
-                    "Maintain offline backups of critical data"
-                ]
-            
-            logger.info("Manual extraction completed successfully")
-            return result
-            
-        except Exception as e:
-            logger.error(f"Manual extraction failed: {str(e)}")
-            # Return basic fallback structure
-            return {
-                'executive_summary': "Manual extraction of executive summary failed. Please check logs for details.",
-                'key_actors': [
-                    {
-                        "name": "Extraction Error",
-                        "description": "Unable to extract threat actor information due to parsing errors."
-                    }
-                ],
-                'critical_iocs': [
-                    {
-                        "type": "error",
-                        "value": "extraction_failed",
-                        "description": "Unable to extract IOC information due to parsing errors."
-                    }
-                ],
-                'recommendations': [
-                    "Manual extraction failed. Please review the raw response data.",
-                    "Consider adjusting the Claude API prompt for better JSON formatting."
-                ]
-            }
\ No newline at end of file
+            # Repair trailing commas, unquoted keys, truncated output and the like
+            logger.warning("Failed to parse JSON response, attempting repair")
+            logger.debug(f"Problematic response text (first 500 chars): {text[json_start:json_start + 500]}")
+            summary_data = json_repair.loads(text[json_start:])
+            if not isinstance(summary_data, dict) or not summary_data:
+                logger.error("Failed to repair JSON response")
+                return None
+        
+        return self.complete_summary(summary_data, fallback_iocs)
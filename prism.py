@@ -7,18 +7,25 @@ stores data in SQLite, and generates executive summaries.
 """
 
 import argparse
+import asyncio
+import functools
 import logging
+import multiprocessing
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
 from modules.config import load_config
 from modules.database import DatabaseManager
-from modules.scraper import ThreatIntelScraper
 from modules.ioc_extractor import IOCExtractor
-from modules.summarizer import ArticleSummarizer, ExecutiveSummarizer
+from modules.llm_cache import LLMCache
 from modules.reporting import ReportGenerator
 
+# The scraper (bs4, lxml, feedparser) and summarizer (anthropic, httpx) are
+# imported by the operations that use them, so other runs, and the IOC
+# extraction worker processes, don't pay for loading them
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -45,6 +52,119 @@ def parse_arguments():
                         help='Run complete workflow (scrape, analyze, report)')
     return parser.parse_args()
 
+# Fewer scraped articles than this are searched for IOCs in-process, as
+# starting worker processes would cost more than it saves
+_MIN_PARALLEL_IOC_ARTICLES = 16
+
+# Worker processes are started from a fork server where available, as forking
+# while other threads (the scraper's, the event loop's) hold locks can
+# deadlock the child
+_MP_CONTEXT = multiprocessing.get_context(
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else None
+)
+
+@functools.lru_cache(maxsize=None)
+def _get_ioc_extractor():
+    """
+    Get the IOC extractor of the current process, built on first use.
+    
+    Returns:
+        IOCExtractor: IOC extractor
+    """
+    return IOCExtractor()
+
+def _extract_iocs(text):
+    """
+    Extract IOCs from text, in a worker process or in-process.
+    
+    Args:
+        text (str): Text to extract IOCs from
+    
+    Returns:
+        dict: Dictionary of IOCs by type
+    """
+    return _get_ioc_extractor().extract_from_text(text)
+
+def _extract_all_iocs(articles, pool):
+    """
+    Extract the IOCs of scraped articles, in parallel for large batches.
+    
+    The regex engine holds the GIL, so the work is spread over processes
+    rather than threads.
+    
+    Args:
+        articles (list): List of Article objects; their iocs are set in place
+        pool (ProcessPoolExecutor): Worker processes for large batches, only
+            started once a batch needs them
+    """
+    contents = [article.content for article in articles]
+    
+    if len(articles) < _MIN_PARALLEL_IOC_ARTICLES:
+        results = map(_extract_iocs, contents)
+    else:
+        results = pool.map(_extract_iocs, contents, chunksize=8)
+    
+    for article, iocs in zip(articles, results):
+        article.iocs = iocs
+
+# Generated summaries are written to the database this many at a time
+_SUMMARY_BATCH_SIZE = 16
+
+class _SummaryWriter:
+    """Buffers generated article summaries and stores them in batches"""
+    
+    def __init__(self, db_manager, batch_size=_SUMMARY_BATCH_SIZE):
+        """
+        Initialize the summary writer.
+        
+        Args:
+            db_manager (DatabaseManager): Database to store the summaries in
+            batch_size (int): Number of summaries stored per transaction
+        """
+        self.db_manager = db_manager
+        self.batch_size = batch_size
+        self.pending = []
+    
+    def add(self, result):
+        """
+        Queue a generated article summary, skipping articles that failed.
+        
+        Args:
+            result (dict): Article id and either a summary or an error key
+        """
+        if 'error' in result:
+            logger.warning(f"Skipping article ID {result['id']}: {result['error']}")
+            return
+        
+        self.pending.append((result['id'], result['summary']))
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+    
+    def flush(self):
+        """Store the queued summaries in database."""
+        if self.pending:
+            self.db_manager.update_article_summaries(self.pending)
+            self.pending = []
+
+async def _analyze_all(article_summarizer, summary_writer, articles, concurrency):
+    """
+    Summarize articles concurrently, queueing each summary for storage as soon as it's ready.
+    
+    Requests are awaited on the event loop, while the prompts of long
+    articles (whose paragraph scoring is CPU-bound) are built in worker
+    processes, started only once such an article comes up.
+    
+    Args:
+        article_summarizer (ArticleSummarizer): Summarizer to use
+        summary_writer (_SummaryWriter): Writer storing the summaries
+        articles (list): List of article dictionaries with id, title, content and iocs keys
+        concurrency (int): Maximum number of summaries generated at a time
+    """
+    with ProcessPoolExecutor(mp_context=_MP_CONTEXT) as pool:
+        await article_summarizer.summarize_articles(
+            articles, concurrency, on_result=summary_writer.add, pool=pool
+        )
+
 def main():
     """Main function to orchestrate the PRISM workflow"""
     args = parse_arguments()
@@ -70,26 +190,36 @@ def main():
             print("No operation specified. Use --scrape, --analyze, --report, or --full-run")
             return
         
+        # Claude responses are cached next to the database, shared by both summarizers
+        llm_cache = None
+        if run_analyze or run_report:
+            llm_cache = LLMCache(os.path.join(os.path.dirname(config['database']['path']), 'llm_cache.db'))
+        
         # 1. Scrape new intelligence
         if run_scrape:
             logger.info("Starting scraping operation")
-            scraper = ThreatIntelScraper(config['sources'])
+            from modules.scraper import ThreatIntelScraper
             
-            for source_name, articles in scraper.scrape_all_sources().items():
-                logger.info(f"Scraped {len(articles)} articles from {source_name}")
-                
-                for article in articles:
-                    # Extract IOCs
-                    ioc_extractor = IOCExtractor()
-                    iocs = ioc_extractor.extract_from_text(article['content'])
-                    article['iocs'] = iocs
+            http_cache_path = os.path.join(os.path.dirname(config['database']['path']), 'http_cache')
+            with ThreatIntelScraper(config['sources'], http_cache_path=http_cache_path,
+                                    seen_urls=db_manager.get_known_urls()) as scraper, \
+                    ProcessPoolExecutor(mp_context=_MP_CONTEXT) as pool:
+                # Each source is processed as soon as it's scraped, while the
+                # remaining sources are still being fetched
+                for source_name, articles in scraper.iter_scrape_all_sources():
+                    logger.info(f"Scraped {len(articles)} articles from {source_name}")
                     
-                    # Store article in database
-                    article_id = db_manager.store_article(article)
+                    # Extract IOCs
+                    _extract_all_iocs(articles, pool)
                     
-                    # Store IOCs in database
-                    if iocs:
-                        db_manager.store_iocs(article_id, iocs)
+                    # Store the source's articles and their IOCs in database, one
+                    # transaction each
+                    article_ids = db_manager.store_articles_bulk([article.to_dict() for article in articles])
+                    db_manager.store_iocs_bulk([
+                        (article_id, article.iocs)
+                        for article_id, article in zip(article_ids, articles)
+                        if article_id is not None and article.iocs
+                    ])
             
             logger.info("Scraping operation completed")
         
@@ -102,22 +232,34 @@ def main():
             logger.info(f"Found {len(articles)} articles to analyze")
             
             if articles:
-                article_summarizer = ArticleSummarizer(config['ai']['api_key'])
+                from modules.summarizer import ArticleSummarizer
                 
+                article_summarizer = ArticleSummarizer(
+                    config['ai']['api_key'],
+                    cache=llm_cache,
+                    requests_per_minute=config['ai'].get('requests_per_minute')
+                )
+                
+                iocs = db_manager.get_iocs_for_articles([article['id'] for article in articles])
                 for article in articles:
-                    article_id = article['id']
-                    logger.info(f"Analyzing article ID: {article_id}")
-                    
-                    # Generate summary using AI
-                    summary = article_summarizer.summarize(
-                        title=article['title'],
-                        content=article['content'],
-                        iocs=db_manager.get_iocs_for_article(article_id)
-                    )
-                    
-                    # Store summary in database
-                    db_manager.update_article_summary(article_id, summary)
-                    
+                    article['iocs'] = iocs[article['id']]
+                
+                summary_writer = _SummaryWriter(db_manager)
+                
+                # Large backlogs go through the Message Batches API (half the
+                # cost, but results can take up to 24 hours) when enabled
+                batch_threshold = config['ai'].get('batch_threshold')
+                if batch_threshold and len(articles) >= batch_threshold:
+                    for result in article_summarizer.summarize_articles_via_batch(articles):
+                        summary_writer.add(result)
+                else:
+                    # Generate summaries using AI, several requests at a time
+                    asyncio.run(_analyze_all(
+                        article_summarizer, summary_writer, articles,
+                        config['ai'].get('max_concurrency', 8)
+                    ))
+                summary_writer.flush()
+                
                 logger.info("Analysis operation completed")
             else:
                 logger.info("No articles require analysis")
@@ -133,7 +275,12 @@ def main():
             
             if recent_articles:
                 # Generate executive summary
-                executive_summarizer = ExecutiveSummarizer(config['ai']['api_key'])
+                from modules.summarizer import ExecutiveSummarizer
+                
+                executive_summarizer = ExecutiveSummarizer(
+                    config['ai']['api_key'],
+                    cache=llm_cache
+                )
                 executive_summary = executive_summarizer.create_summary(recent_articles)
                 
                 # Generate report file